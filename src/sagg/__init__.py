@@ -8,23 +8,64 @@ Ampcode).
 
 __version__ = "0.1.0"
 
-from sagg.models import (
-    FileChangePart,
-    GitContext,
-    Message,
-    ModelUsage,
-    Part,
-    SessionStats,
-    SourceTool,
-    TextPart,
-    TokenUsage,
-    ToolCallPart,
-    ToolResultPart,
-    Turn,
-    UnifiedSession,
-)
-from sagg.storage import SessionStore
-from sagg.adapters import SessionAdapter, SessionRef, registry
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sagg.adapters import SessionAdapter, SessionRef, registry
+    from sagg.models import (
+        FileChangePart,
+        GitContext,
+        Message,
+        ModelUsage,
+        Part,
+        SessionStats,
+        SourceTool,
+        TextPart,
+        TokenUsage,
+        ToolCallPart,
+        ToolResultPart,
+        Turn,
+        UnifiedSession,
+    )
+    from sagg.storage import SessionStore
+
+# Public names are imported on first access (PEP 562), so importing a
+# submodule such as sagg.cli doesn't pull in every adapter up front.
+_LAZY_ATTRS = {
+    **dict.fromkeys(
+        [
+            "FileChangePart",
+            "GitContext",
+            "Message",
+            "ModelUsage",
+            "Part",
+            "SessionStats",
+            "SourceTool",
+            "TextPart",
+            "TokenUsage",
+            "ToolCallPart",
+            "ToolResultPart",
+            "Turn",
+            "UnifiedSession",
+        ],
+        "sagg.models",
+    ),
+    "SessionStore": "sagg.storage",
+    "SessionAdapter": "sagg.adapters",
+    "SessionRef": "sagg.adapters",
+    "registry": "sagg.adapters",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "__version__",
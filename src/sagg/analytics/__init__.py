@@ -3,6 +3,7 @@
 from sagg.analytics.heatmap import (
     get_activity_by_day,
     generate_heatmap_data,
+    generate_heatmap_data_with_totals,
     render_heatmap,
     calculate_intensity,
 )
@@ -33,6 +34,7 @@ from sagg.analytics.friction import (
 __all__ = [
     "get_activity_by_day",
     "generate_heatmap_data",
+    "generate_heatmap_data_with_totals",
     "render_heatmap",
     "calculate_intensity",
     "SimilarityResult",
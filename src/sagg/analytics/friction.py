@@ -7,9 +7,12 @@ problematic coding sessions.
 
 from __future__ import annotations
 
+import heapq
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from itertools import islice
 from typing import TYPE_CHECKING
 
 from sagg.models import ToolCallPart, ToolResultPart, TextPart
@@ -206,24 +209,57 @@ def detect_friction_points(
     error_threshold: float = 0.3,
     back_forth_threshold: int = 5,
     limit: int = 500,
+    top: int | None = None,
 ) -> list[FrictionPoint]:
     """Analyze sessions for friction patterns.
 
     Args:
         store: SessionStore instance to query.
-        since: Only analyze sessions created after this datetime.
+        since: Only analyze sessions updated after this datetime.
         retry_threshold: Minimum retries to flag as HIGH_RETRIES.
         error_threshold: Minimum error rate to flag as ERROR_RATE.
         back_forth_threshold: Minimum back-and-forth count to flag.
         limit: Maximum number of sessions to analyze.
+        top: Only return this many highest-scoring friction points. Uses a
+            bounded heap instead of sorting every result.
 
     Returns:
         List of FrictionPoint objects sorted by friction score descending.
     """
-    # Get sessions from store
-    sessions = store.list_sessions(since=since, limit=limit)
+    points = _scan_friction_points(
+        store, since, retry_threshold, error_threshold, back_forth_threshold, limit
+    )
 
-    friction_points: list[FrictionPoint] = []
+    if top is not None:
+        return heapq.nlargest(top, points, key=lambda x: x.friction_score)
+
+    # Sort by friction score descending
+    return sorted(points, key=lambda x: x.friction_score, reverse=True)
+
+
+def _scan_friction_points(
+    store: SessionStore,
+    since: datetime | None,
+    retry_threshold: int,
+    error_threshold: float,
+    back_forth_threshold: int,
+    limit: int,
+) -> Iterator[FrictionPoint]:
+    """Yield a FrictionPoint for each analyzed session with friction.
+
+    Args:
+        store: SessionStore instance to query.
+        since: Only analyze sessions updated after this datetime.
+        retry_threshold: Minimum retries to flag as HIGH_RETRIES.
+        error_threshold: Minimum error rate to flag as ERROR_RATE.
+        back_forth_threshold: Minimum back-and-forth count to flag.
+        limit: Maximum number of sessions to analyze.
+
+    Yields:
+        FrictionPoint objects in session order (unsorted).
+    """
+    # Stream sessions from the store, most recently active first
+    sessions = islice(store.iter_sessions(since=since), limit)
 
     for session_meta in sessions:
         # Load full content for analysis
@@ -261,16 +297,11 @@ def detect_friction_points(
                 back_forth_count=back_forth,
             )
 
-            friction_points.append(
-                FrictionPoint(
-                    session_id=full_session.id,
-                    title=full_session.title or "Untitled",
-                    friction_types=friction_types,
-                    friction_score=friction_score,
-                    details=details,
-                    project=full_session.project_name or "Unknown",
-                )
+            yield FrictionPoint(
+                session_id=full_session.id,
+                title=full_session.title or "Untitled",
+                friction_types=friction_types,
+                friction_score=friction_score,
+                details=details,
+                project=full_session.project_name or "Unknown",
             )
-
-    # Sort by friction score descending
-    return sorted(friction_points, key=lambda x: x.friction_score, reverse=True)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -85,11 +86,29 @@ def generate_heatmap_data(activity: dict[str, int], weeks: int) -> list[list[int
     Returns:
         List of 7 rows (Sun-Sat) x N weeks columns, each cell is 0-4 intensity.
     """
+    return generate_heatmap_data_with_totals(activity, weeks)[0]
+
+
+def generate_heatmap_data_with_totals(
+    activity: dict[str, int], weeks: int
+) -> tuple[list[list[int]], int, int]:
+    """Generate the heatmap grid along with the activity totals.
+
+    The summed activity and number of active days are computed in the same
+    pass that finds the maximum for the intensity scale.
+
+    Args:
+        activity: Dictionary mapping date strings (YYYY-MM-DD) to counts.
+        weeks: Number of weeks to include.
+
+    Returns:
+        Tuple of (grid as returned by generate_heatmap_data, total, active days).
+    """
     # Initialize grid: 7 rows (days) x weeks columns
     grid: list[list[int]] = [[0] * weeks for _ in range(7)]
 
     if not activity:
-        return grid
+        return grid, 0, 0
 
     # Calculate the date range
     today = datetime.now(timezone.utc).date()
@@ -105,8 +124,13 @@ def generate_heatmap_data(activity: dict[str, int], weeks: int) -> list[list[int
     days_from_sunday = (start_date.weekday() + 1) % 7
     start_date = start_date - timedelta(days=days_from_sunday)
 
-    # Find max value for intensity calculation
-    max_value = max(activity.values()) if activity else 0
+    # Find max value for intensity calculation (and the total, in one pass)
+    max_value = 0
+    total = 0
+    for value in activity.values():
+        total += value
+        if value > max_value:
+            max_value = value
 
     # Fill in the grid
     current_date = start_date
@@ -118,7 +142,7 @@ def generate_heatmap_data(activity: dict[str, int], weeks: int) -> list[list[int
                 grid[day_idx][week_idx] = calculate_intensity(value, max_value)
             current_date += timedelta(days=1)
 
-    return grid
+    return grid, total, len(activity)
 
 
 def render_heatmap(data: list[list[int]], legend: bool = True) -> str:
@@ -151,6 +175,31 @@ def render_heatmap(data: list[list[int]], legend: bool = True) -> str:
     return "\n".join(lines)
 
 
+def render_month_header(weeks: int, label_width: int = 6) -> str:
+    """Render the month label line shown above the heatmap grid.
+
+    Args:
+        weeks: Number of weeks in the heatmap.
+        label_width: Width of the day-label column to indent by.
+
+    Returns:
+        Header string with month names aligned to their week columns.
+    """
+    return _month_header(weeks, label_width, datetime.now(timezone.utc).date())
+
+
+@lru_cache(maxsize=16)
+def _month_header(weeks: int, label_width: int, today: date) -> str:
+    """Build the month header; cached per day since labels depend on today."""
+    parts = [" " * label_width]
+    prev_pos = 0
+    for pos, label in _month_labels(weeks, today):
+        parts.append(" " * (pos - prev_pos))
+        parts.append(label)
+        prev_pos = pos + len(label)
+    return "".join(parts)
+
+
 def get_month_labels(weeks: int) -> list[tuple[int, str]]:
     """Get month labels with their positions for the heatmap header.
 
@@ -160,7 +209,11 @@ def get_month_labels(weeks: int) -> list[tuple[int, str]]:
     Returns:
         List of (week_position, month_name) tuples.
     """
-    today = datetime.now(timezone.utc).date()
+    return _month_labels(weeks, datetime.now(timezone.utc).date())
+
+
+def _month_labels(weeks: int, today: date) -> list[tuple[int, str]]:
+    """Compute month labels for a heatmap ending on the given day."""
     start_date = today - timedelta(days=(weeks * 7) - 1)
     # Adjust start to the Sunday of that week
     days_from_sunday = (start_date.weekday() + 1) % 7
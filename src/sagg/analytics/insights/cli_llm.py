@@ -16,6 +16,9 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from sagg.models import UnifiedSession
 
+# Shortest condensed transcript that still counts as a substantive session
+_MIN_SUBSTANTIVE_CHARS = 40
+
 # CLI backends in detection order
 BACKENDS = [
     {
@@ -198,6 +201,8 @@ def condense_transcript(session: UnifiedSession, max_chars: int = 8000) -> str:
     char_count = 0
 
     for turn in session.turns:
+        if char_count >= max_chars:
+            break
         for message in turn.messages:
             if char_count >= max_chars:
                 break
@@ -307,8 +312,10 @@ def is_session_substantive(session: UnifiedSession) -> bool:
     """Return True when a session appears meaningful enough for LLM analysis."""
     if session.stats.message_count > 0 and session.stats.turn_count > 0:
         return True
-    transcript = condense_transcript(session, max_chars=600)
-    return len(transcript.strip()) >= 40
+    # Condensing stops once the budget is reached, so only walk as much of
+    # the transcript as the length check needs
+    transcript = condense_transcript(session, max_chars=_MIN_SUBSTANTIVE_CHARS)
+    return len(transcript.strip()) >= _MIN_SUBSTANTIVE_CHARS
 
 
 def analyze_sessions_llm_batch(
@@ -6,12 +6,14 @@ find past solutions to similar problems.
 
 from __future__ import annotations
 
+import heapq
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from sagg.models import UnifiedSession
     from sagg.storage import SessionStore
 
 
@@ -62,7 +64,10 @@ def search_history(
     if not search_results:
         return []
 
-    results: list[OracleResult] = []
+    # Score every candidate first; the snippet extraction below is the costly
+    # part, so it only runs for the sessions that make the cut
+    now = datetime.now(timezone.utc)
+    scored: list[tuple[float, UnifiedSession]] = []
 
     for session, raw_rank in search_results:
         # FTS5 rank is negative (more negative = better match)
@@ -72,7 +77,6 @@ def search_history(
         normalized_score = min(1.0, max(0.0, (-raw_rank) / 30.0))
 
         # Apply recency boost (sessions within last week get up to 10% boost)
-        now = datetime.now(timezone.utc)
         if session.created_at.tzinfo is None:
             session_time = session.created_at.replace(tzinfo=timezone.utc)
         else:
@@ -81,7 +85,12 @@ def search_history(
         age_days = (now - session_time).days
         recency_boost = max(0, 0.1 * (1 - age_days / 7)) if age_days < 7 else 0
         final_score = min(1.0, normalized_score + recency_boost)
+        scored.append((round(final_score, 2), session))
 
+    results: list[OracleResult] = []
+
+    # Highest relevance first; ties keep FTS5 rank order
+    for score, session in heapq.nlargest(limit, scored, key=lambda item: item[0]):
         # Get the matched text snippet from session content
         content = session.extract_text_content()
         matched_text = extract_snippet(content, query, context_chars=100)
@@ -98,18 +107,14 @@ def search_history(
             OracleResult(
                 session_id=session.id,
                 title=session.title or "Untitled Session",
-                relevance_score=round(final_score, 2),
+                relevance_score=score,
                 matched_text=matched_text,
                 project=session.project_name or "Unknown",
                 timestamp=session.created_at,
             )
         )
 
-    # Sort by relevance score (descending)
-    results.sort(key=lambda r: r.relevance_score, reverse=True)
-
-    # Apply limit after sorting
-    return results[:limit]
+    return results
 
 
 def extract_snippet(content: str, query: str, context_chars: int = 100) -> str:
@@ -151,6 +156,37 @@ def extract_snippet(content: str, query: str, context_chars: int = 100) -> str:
     return f"{prefix}{snippet}{suffix}"
 
 
+# (upper bound in seconds, unit in seconds, suffix); anything older is in weeks
+_TIME_AGO_BUCKETS = (
+    (3600, 60, "m ago"),
+    (86400, 3600, "h ago"),
+    (604800, 86400, " days ago"),
+)
+
+
+def format_time_ago(timestamp: datetime, now: datetime | None = None) -> str:
+    """Format how long ago a timestamp was, e.g. '5m ago' or '3 days ago'.
+
+    Args:
+        timestamp: The datetime to describe. Naive values are treated as UTC.
+        now: Reference time. Defaults to the current time; pass it in when
+            formatting many results so it is computed once.
+
+    Returns:
+        A human-readable time-ago string.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+
+    seconds = (now - timestamp).total_seconds()
+    for limit, unit, suffix in _TIME_AGO_BUCKETS:
+        if seconds < limit:
+            return f"{int(seconds / unit)}{suffix}"
+    return f"{int(seconds / 604800)} weeks ago"
+
+
 def format_result(result: OracleResult) -> str:
     """Format a result for terminal display.
 
@@ -160,24 +196,7 @@ def format_result(result: OracleResult) -> str:
     Returns:
         A formatted string representation of the result.
     """
-    # Calculate time ago
-    now = datetime.now(timezone.utc)
-    if result.timestamp.tzinfo is None:
-        timestamp = result.timestamp.replace(tzinfo=timezone.utc)
-    else:
-        timestamp = result.timestamp
-
-    delta = now - timestamp
-    seconds = delta.total_seconds()
-
-    if seconds < 3600:
-        time_ago = f"{int(seconds / 60)}m ago"
-    elif seconds < 86400:
-        time_ago = f"{int(seconds / 3600)}h ago"
-    elif seconds < 604800:
-        time_ago = f"{int(seconds / 86400)} days ago"
-    else:
-        time_ago = f"{int(seconds / 604800)} weeks ago"
+    time_ago = format_time_ago(result.timestamp)
 
     # Format relevance as percentage
     relevance_pct = int(result.relevance_score * 100)
@@ -202,7 +221,7 @@ def format_results_rich(
         results: List of OracleResult objects to display.
         query: The original search query.
     """
-    from rich.console import Console
+    from rich.console import Console, Group
     from rich.panel import Panel
     from rich.text import Text
 
@@ -215,25 +234,12 @@ def format_results_rich(
     console.print(f'[bold]Oracle: "{query}"[/bold]')
     console.print(f"Found {len(results)} relevant session(s):\n")
 
-    for result in results:
-        # Calculate time ago
-        now = datetime.now(timezone.utc)
-        if result.timestamp.tzinfo is None:
-            timestamp = result.timestamp.replace(tzinfo=timezone.utc)
-        else:
-            timestamp = result.timestamp
-
-        delta = now - timestamp
-        seconds = delta.total_seconds()
+    # Collect all panels and render them in a single pass
+    renderables: list[Panel | Text] = []
 
-        if seconds < 3600:
-            time_ago = f"{int(seconds / 60)}m ago"
-        elif seconds < 86400:
-            time_ago = f"{int(seconds / 3600)}h ago"
-        elif seconds < 604800:
-            time_ago = f"{int(seconds / 86400)} days ago"
-        else:
-            time_ago = f"{int(seconds / 604800)} weeks ago"
+    now = datetime.now(timezone.utc)
+    for result in results:
+        time_ago = format_time_ago(result.timestamp, now)
 
         # Format relevance as percentage
         relevance_pct = int(result.relevance_score * 100)
@@ -249,11 +255,13 @@ def format_results_rich(
         # Create panel with title showing relevance
         panel_title = f"Session: {result.title} ({relevance_pct}% match)"
 
-        console.print(
+        renderables.append(
             Panel(
                 panel_content,
                 title=panel_title,
                 border_style="blue",
             )
         )
-        console.print()  # Spacing between panels
+        renderables.append(Text())  # Spacing between panels
+
+    console.print(Group(*renderables))
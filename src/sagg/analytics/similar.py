@@ -7,9 +7,11 @@ No external ML dependencies required.
 
 from __future__ import annotations
 
+import heapq
 import re
 from collections import Counter
 from dataclasses import dataclass
+from itertools import islice
 from math import log, sqrt
 from typing import TYPE_CHECKING
 
@@ -146,7 +148,11 @@ def compute_tfidf(documents: dict[str, str]) -> dict[str, dict[str, float]]:
     return tfidf_vectors
 
 
-def cosine_similarity(vec1: dict[str, float], vec2: dict[str, float]) -> float:
+def cosine_similarity(
+    vec1: dict[str, float],
+    vec2: dict[str, float],
+    magnitude1: float | None = None,
+) -> float:
     """Compute cosine similarity between two TF-IDF vectors.
 
     Cosine similarity measures the cosine of the angle between two vectors,
@@ -155,6 +161,8 @@ def cosine_similarity(vec1: dict[str, float], vec2: dict[str, float]) -> float:
     Args:
         vec1: First TF-IDF vector (term -> weight mapping).
         vec2: Second TF-IDF vector (term -> weight mapping).
+        magnitude1: Precomputed magnitude of vec1, for scoring many vectors
+            against the same one.
 
     Returns:
         Cosine similarity score between 0.0 and 1.0.
@@ -162,17 +170,16 @@ def cosine_similarity(vec1: dict[str, float], vec2: dict[str, float]) -> float:
     if not vec1 or not vec2:
         return 0.0
 
-    # Find common terms
-    common_terms = set(vec1.keys()) & set(vec2.keys())
+    # Walk the smaller vector and probe the larger one for common terms
+    small, large = (vec1, vec2) if len(vec1) <= len(vec2) else (vec2, vec1)
+    dot_product = sum(weight * large[term] for term, weight in small.items() if term in large)
 
-    if not common_terms:
+    if not dot_product:
         return 0.0
 
-    # Compute dot product
-    dot_product = sum(vec1[term] * vec2[term] for term in common_terms)
-
     # Compute magnitudes
-    magnitude1 = sqrt(sum(v * v for v in vec1.values()))
+    if magnitude1 is None:
+        magnitude1 = sqrt(sum(v * v for v in vec1.values()))
     magnitude2 = sqrt(sum(v * v for v in vec2.values()))
 
     if magnitude1 == 0 or magnitude2 == 0:
@@ -270,8 +277,10 @@ def find_similar_sessions(
     if not query_vector:
         return []
 
-    # Tokenize query for matched terms detection
-    query_tokens = set(tokenize(query))
+    # The query vector is keyed by the query's unique tokens, so reuse those
+    # for matched terms detection instead of tokenizing the query again
+    query_tokens = query_vector.keys()
+    query_magnitude = sqrt(sum(v * v for v in query_vector.values()))
 
     # Score and rank candidates
     results: list[SimilarityResult] = []
@@ -281,11 +290,11 @@ def find_similar_sessions(
         if not candidate_vector:
             continue
 
-        score = cosine_similarity(query_vector, candidate_vector)
+        score = cosine_similarity(query_vector, candidate_vector, query_magnitude)
 
-        # Find matched terms
-        candidate_terms = set(candidate_vector.keys())
-        matched_terms = list(query_tokens & candidate_terms)[:10]  # Limit to 10 terms
+        # Find matched terms by probing the candidate's vector directly, in
+        # query order, stopping once the 10-term display limit is reached
+        matched_terms = list(islice((t for t in query_tokens if t in candidate_vector), 10))
 
         results.append(
             SimilarityResult(
@@ -297,8 +306,5 @@ def find_similar_sessions(
             )
         )
 
-    # Sort by score descending
-    results.sort(key=lambda r: r.score, reverse=True)
-
-    # Return top results
-    return results[:limit]
+    # Top results by score, without sorting the rest
+    return heapq.nlargest(limit, results, key=lambda r: r.score)
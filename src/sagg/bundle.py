@@ -97,61 +97,49 @@ def export_bundle(
     Returns:
         Number of sessions exported.
     """
-    # Build query parameters
-    sessions = store.list_sessions(
-        source=source,
-        project=project,
-        limit=100000,  # Large limit to get all matching sessions
+    # Large limit to get all matching sessions
+    max_sessions = 100000
+    session_count = min(
+        store.count_sessions(source=source, project=project, since=since), max_sessions
     )
 
-    # Apply since filter
-    if since is not None:
-        sessions = [s for s in sessions if s.created_at >= since]
-
-    # Prepare content for checksum calculation
-    content_lines = []
-
     # Header
     header = BundleHeader(
         machine_id=get_machine_id(),
         exported_at=datetime.now(timezone.utc).isoformat(),
-        session_count=len(sessions),
-    )
-    header_json = json.dumps(asdict(header))
-    content_lines.append(header_json)
-
-    # Sessions
-    for session in sessions:
-        # Get full session with content
-        full_session = store.get_session(session.id)
-        if full_session is None:
-            continue
-
-        session_data = {
-            "type": "session",
-            **full_session.model_dump(mode="json"),
-        }
-        session_json = json.dumps(session_data)
-        content_lines.append(session_json)
-
-    # Calculate checksum of header + sessions
-    content_for_checksum = "\n".join(content_lines)
-    checksum = hashlib.sha256(content_for_checksum.encode("utf-8")).hexdigest()
-
-    # Footer
-    footer = BundleFooter(
-        checksum=f"sha256:{checksum}",
-        session_count=len(sessions),
+        session_count=session_count,
     )
-    footer_json = json.dumps(asdict(footer))
-    content_lines.append(footer_json)
 
-    # Write gzipped bundle
+    # Sessions are serialized, hashed and compressed one at a time; the
+    # checksum covers header + sessions exactly as they are written
+    digest = hashlib.sha256()
+
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with gzip.open(output_path, "wt", encoding="utf-8") as f:
-        f.write("\n".join(content_lines))
+    with gzip.open(output_path, "wt", encoding="utf-8", compresslevel=6) as f:
+
+        def write(text: str) -> None:
+            f.write(text)
+            digest.update(text.encode("utf-8"))
+
+        write(json.dumps(asdict(header)))
 
-    return len(sessions)
+        for session in store.iter_sessions_full(
+            limit=max_sessions, source=source, project=project, since=since
+        ):
+            session_data = {
+                "type": "session",
+                **session.model_dump(mode="json"),
+            }
+            write("\n" + json.dumps(session_data))
+
+        # Footer
+        footer = BundleFooter(
+            checksum=f"sha256:{digest.hexdigest()}",
+            session_count=session_count,
+        )
+        f.write("\n" + json.dumps(asdict(footer)))
+
+    return session_count
 
 
 def import_bundle(
@@ -287,18 +275,32 @@ def verify_bundle(bundle_path: Path) -> bool:
     Returns:
         True if the bundle is valid and uncorrupted, False otherwise.
     """
+    # The checksum covers every line but the footer, joined with "\n". Hash the
+    # lines as they are decompressed, keeping a copy of the digest from before
+    # the latest line so the footer can be excluded once the end is reached.
+    digest = hashlib.sha256()
+    before_last = None
+    last_line = b""
+    line_count = 0
     try:
-        with gzip.open(bundle_path, "rt", encoding="utf-8") as f:
-            lines = f.read().strip().split("\n")
+        with gzip.open(bundle_path, "rb") as f:
+            for line in f:
+                line = line.rstrip(b"\n")
+                before_last = digest.copy()
+                if line_count:
+                    digest.update(b"\n")
+                digest.update(line)
+                last_line = line
+                line_count += 1
     except Exception:
         return False
 
-    if len(lines) < 2:
+    if line_count < 2 or before_last is None:
         return False
 
     # Parse footer
     try:
-        footer = json.loads(lines[-1])
+        footer = json.loads(last_line)
         if footer.get("type") != "footer":
             return False
 
@@ -307,11 +309,9 @@ def verify_bundle(bundle_path: Path) -> bool:
             return False
 
         stored_hash = stored_checksum[7:]  # Remove "sha256:" prefix
-    except json.JSONDecodeError:
+    except ValueError:  # Malformed JSON or invalid UTF-8
         return False
 
-    # Calculate checksum of header + sessions (all lines except footer)
-    content_for_checksum = "\n".join(lines[:-1])
-    calculated_hash = hashlib.sha256(content_for_checksum.encode("utf-8")).hexdigest()
+    calculated_hash = before_last.hexdigest()
 
     return calculated_hash == stored_hash
@@ -2,27 +2,50 @@
 
 from __future__ import annotations
 
-import re
+import json
+import queue
 import sys
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Iterable
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING
+from functools import lru_cache, wraps
+from itertools import chain, groupby, islice
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, TextIO
 
 import click
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
-from rich.syntax import Syntax
 from rich.table import Table
+from rich.text import Text
 
-from sagg.adapters import registry
-from sagg.models import TextPart, ToolCallPart, ToolResultPart
 from sagg.storage import SessionStore
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
+    from sagg.adapters.base import SessionAdapter
+    from sagg.export.agenttrace import AgentTraceRecord
     from sagg.models import UnifiedSession
+    from sagg.security import DataScrubber
 
 console = Console()
 error_console = Console(stderr=True)
 
+# Similarity score style, indexed by (pct >= 40) + (pct >= 70)
+_SIMILAR_SCORE_STYLES = ("dim", "yellow", "green")
+
+# Details cell of one `similar` result, shown to the right of its rank
+_SIMILAR_DETAILS_TMPL = (
+    "[bold]{title}[/bold] ([{style}]{pct}% similar[/{style}])\n"
+    "[cyan]{project}[/cyan] [dim]•[/dim] [dim]{session_id}[/dim]"
+)
+
+# Multipliers for the fixed suffix grammars of parse_token_amount / parse_duration
+_TOKEN_SUFFIXES = {"k": 1000, "m": 1000000}
+_DURATION_UNITS = {"h": timedelta(hours=1), "d": timedelta(days=1), "w": timedelta(weeks=1)}
+
 
 def parse_token_amount(s: str) -> int:
     """Parse token amount string like '500k', '1M', '100000' to integer.
@@ -46,16 +69,12 @@ def parse_token_amount(s: str) -> int:
     if not s:
         raise ValueError("Empty token amount")
 
-    # Try matching with suffix (k, K, m, M)
-    match = re.match(r"^(\d+(?:\.\d+)?)([kKmM])$", s)
-    if match:
-        value = float(match.group(1))
-        suffix = match.group(2).lower()
-
-        if suffix == "k":
-            return int(value * 1000)
-        elif suffix == "m":
-            return int(value * 1000000)
+    # Try a number with suffix (k, K, m, M), e.g. 500k or 2.5M
+    multiplier = _TOKEN_SUFFIXES.get(s[-1].lower())
+    if multiplier is not None:
+        whole, dot, fraction = s[:-1].partition(".")
+        if whole.isdecimal() and (not dot or fraction.isdecimal()):
+            return int(float(s[:-1]) * multiplier)
 
     # Try plain integer
     try:
@@ -66,6 +85,7 @@ def parse_token_amount(s: str) -> int:
     raise ValueError(f"Invalid token amount format: '{s}'. Use format like '500k', '1M', or '100000'")
 
 
+@lru_cache(maxsize=64)
 def parse_duration(s: str) -> timedelta:
     """Parse duration string like '7d', '2w', '1h' to timedelta.
 
@@ -83,51 +103,67 @@ def parse_duration(s: str) -> timedelta:
     Raises:
         ValueError: If the duration string format is invalid.
     """
-    match = re.match(r"^(\d+)([hdw])$", s.lower())
-    if match is None:
+    unit = _DURATION_UNITS.get(s[-1:].lower())
+    digits = s[:-1]
+    if unit is None or not digits.isdecimal():
         raise ValueError(f"Invalid duration format: '{s}'. Use format like '7d', '2w', or '24h'")
 
-    value = int(match.group(1))
-    unit = match.group(2)
+    return unit * int(digits)
 
-    if unit == "h":
-        return timedelta(hours=value)
-    elif unit == "d":
-        return timedelta(days=value)
-    elif unit == "w":
-        return timedelta(weeks=value)
-    else:
-        raise ValueError(f"Unknown unit: {unit}")
+
+# Header style for each message role in print_session_detail
+_ROLE_STYLES = {
+    "user": "bold blue",
+    "assistant": "bold green",
+    "system": "bold yellow",
+    "tool": "bold magenta",
+}
+
+# (upper bound in seconds, seconds per unit, suffix) for format_age; older is weeks
+_AGE_BUCKETS = (
+    (3600, 60, "m ago"),
+    (86400, 3600, "h ago"),
+    (604800, 86400, "d ago"),
+)
 
 
-def format_age(dt: datetime) -> str:
+def format_age(dt: datetime, now: datetime | None = None) -> str:
     """Format a datetime as a human-readable age string.
 
     Args:
         dt: The datetime to format.
+        now: Reference time. Defaults to the current UTC time; pass it in
+            when formatting many rows so they share one clock read.
 
     Returns:
         Human-readable age like '2h ago', '3d ago', '1w ago'.
     """
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
 
-    delta = now - dt
-    seconds = delta.total_seconds()
-
-    if seconds < 3600:
-        minutes = int(seconds / 60)
-        return f"{minutes}m ago"
-    elif seconds < 86400:
-        hours = int(seconds / 3600)
-        return f"{hours}h ago"
-    elif seconds < 604800:
-        days = int(seconds / 86400)
-        return f"{days}d ago"
-    else:
-        weeks = int(seconds / 604800)
-        return f"{weeks}w ago"
+    seconds = (now - dt).total_seconds()
+    for limit, unit, suffix in _AGE_BUCKETS:
+        if seconds < limit:
+            return f"{int(seconds / unit)}{suffix}"
+    return f"{int(seconds / 604800)}w ago"
+
+
+def format_size(size_bytes: int) -> str:
+    """Format a byte count as a human-readable size string.
+
+    Args:
+        size_bytes: Size in bytes.
+
+    Returns:
+        Size string like '512 bytes', '3.2 KB', or '1.4 MB'.
+    """
+    if size_bytes >= 1 << 20:
+        return f"{size_bytes / (1 << 20):.1f} MB"
+    if size_bytes >= 1 << 10:
+        return f"{size_bytes / (1 << 10):.1f} KB"
+    return f"{size_bytes} bytes"
 
 
 def truncate_id(session_id: str, length: int = 8) -> str:
@@ -145,16 +181,41 @@ def truncate_id(session_id: str, length: int = 8) -> str:
     return session_id[:length] + "..."
 
 
-def print_sessions_table(sessions: list[UnifiedSession]) -> None:
+def with_store(fn: Callable[..., None]) -> Callable[..., None]:
+    """Open a SessionStore for a command, pass it as the first argument, and close it.
+
+    Exits with an error message if the store cannot be initialized.
+    """
+
+    @wraps(fn)
+    def wrapper(*args: object, **kwargs: object) -> None:
+        try:
+            store = SessionStore()
+        except Exception as e:
+            error_console.print(f"[red]Error initializing store:[/red] {e}")
+            sys.exit(1)
+
+        try:
+            fn(store, *args, **kwargs)
+        finally:
+            store.close()
+
+    return wrapper
+
+
+def print_sessions_table(
+    sessions: Iterable[UnifiedSession | tuple[str, str, str | None, str | None, datetime]],
+) -> None:
     """Print sessions in a formatted table.
 
+    Rows are added as the iterable is consumed, so callers can pass a
+    generator instead of building a list first.
+
     Args:
-        sessions: List of sessions to display.
+        sessions: Sessions to display, either as models or as
+            (id, source, title, project_name, created_at) summary tuples
+            from SessionStore.list_session_summaries.
     """
-    if not sessions:
-        console.print("[dim]No sessions found.[/dim]")
-        return
-
     table = Table(show_header=True, header_style="bold")
     table.add_column("ID", style="cyan")
     table.add_column("Source", style="magenta")
@@ -162,15 +223,23 @@ def print_sessions_table(sessions: list[UnifiedSession]) -> None:
     table.add_column("Project", style="green")
     table.add_column("Age", style="yellow")
 
-    for session in sessions:
+    now = datetime.now(timezone.utc)
+    for row in sessions:
+        if not isinstance(row, tuple):
+            row = (row.id, row.source.value, row.title, row.project_name, row.created_at)
+        session_id, source, title, project_name, created_at = row
         table.add_row(
-            truncate_id(session.id, 12),
-            session.source.value,
-            (session.title or "[dim]Untitled[/dim]")[:40],
-            session.project_name or "[dim]—[/dim]",
-            format_age(session.created_at),
+            truncate_id(session_id, 12),
+            source,
+            (title or "[dim]Untitled[/dim]")[:40],
+            project_name or "[dim]—[/dim]",
+            format_age(created_at, now),
         )
 
+    if not table.row_count:
+        console.print("[dim]No sessions found.[/dim]")
+        return
+
     console.print(table)
 
 
@@ -186,39 +255,44 @@ def print_session_detail(session: UnifiedSession, as_json: bool = False) -> None
         return
 
     # Session header panel
-    header_content = f"""[bold]ID:[/bold] {session.id}
-[bold]Source:[/bold] {session.source.value}
-[bold]Source ID:[/bold] {session.source_id}
-[bold]Title:[/bold] {session.title or "[dim]Untitled[/dim]"}
-[bold]Project:[/bold] {session.project_name or "[dim]—[/dim]"} ({session.project_path or "[dim]—[/dim]"})
-[bold]Created:[/bold] {session.created_at.isoformat()}
-[bold]Updated:[/bold] {session.updated_at.isoformat()}
-[bold]Duration:[/bold] {session.duration_ms or 0}ms"""
+    header_lines = [
+        f"[bold]ID:[/bold] {session.id}",
+        f"[bold]Source:[/bold] {session.source.value}",
+        f"[bold]Source ID:[/bold] {session.source_id}",
+        f"[bold]Title:[/bold] {session.title or '[dim]Untitled[/dim]'}",
+        f"[bold]Project:[/bold] {session.project_name or '[dim]—[/dim]'} "
+        f"({session.project_path or '[dim]—[/dim]'})",
+        f"[bold]Created:[/bold] {session.created_at.isoformat()}",
+        f"[bold]Updated:[/bold] {session.updated_at.isoformat()}",
+        f"[bold]Duration:[/bold] {session.duration_ms or 0}ms",
+    ]
 
     if session.git:
-        header_content += f"""
-[bold]Git Branch:[/bold] {session.git.branch or "[dim]—[/dim]"}
-[bold]Git Commit:[/bold] {session.git.commit or "[dim]—[/dim]"}"""
+        header_lines.append(f"[bold]Git Branch:[/bold] {session.git.branch or '[dim]—[/dim]'}")
+        header_lines.append(f"[bold]Git Commit:[/bold] {session.git.commit or '[dim]—[/dim]'}")
 
-    console.print(Panel(header_content, title="Session Details", border_style="blue"))
+    console.print(Panel("\n".join(header_lines), title="Session Details", border_style="blue"))
 
     # Stats panel
     stats = session.stats
-    stats_content = f"""[bold]Turns:[/bold] {stats.turn_count}
-[bold]Messages:[/bold] {stats.message_count}
-[bold]Input Tokens:[/bold] {stats.input_tokens:,}
-[bold]Output Tokens:[/bold] {stats.output_tokens:,}
-[bold]Tool Calls:[/bold] {stats.tool_call_count}
-[bold]Files Modified:[/bold] {len(stats.files_modified)}"""
-
-    if stats.files_modified:
-        stats_content += "\n\n[bold]Modified Files:[/bold]"
-        for f in stats.files_modified[:10]:
-            stats_content += f"\n  • {f}"
-        if len(stats.files_modified) > 10:
-            stats_content += f"\n  [dim]... and {len(stats.files_modified) - 10} more[/dim]"
-
-    console.print(Panel(stats_content, title="Statistics", border_style="green"))
+    files_modified = stats.files_modified
+    stats_lines = [
+        f"[bold]Turns:[/bold] {stats.turn_count}",
+        f"[bold]Messages:[/bold] {stats.message_count}",
+        f"[bold]Input Tokens:[/bold] {stats.input_tokens:,}",
+        f"[bold]Output Tokens:[/bold] {stats.output_tokens:,}",
+        f"[bold]Tool Calls:[/bold] {stats.tool_call_count}",
+        f"[bold]Files Modified:[/bold] {len(files_modified)}",
+    ]
+
+    if files_modified:
+        n_files = len(files_modified)
+        stats_lines += ["", "[bold]Modified Files:[/bold]"]
+        stats_lines.extend(f"  • {f}" for f in files_modified[:10])
+        if n_files > 10:
+            stats_lines.append(f"  [dim]... and {n_files - 10} more[/dim]")
+
+    console.print(Panel("\n".join(stats_lines), title="Statistics", border_style="green"))
 
     # Models panel
     if session.models:
@@ -242,38 +316,33 @@ def print_session_detail(session: UnifiedSession, as_json: bool = False) -> None
 
     # Messages (turns)
     if session.turns:
+        from sagg.models import TextPart, ToolCallPart, ToolResultPart
+
         console.print(Panel("[bold]Conversation[/bold]", border_style="yellow"))
 
         for turn in session.turns:
             for message in turn.messages:
-                role_style = {
-                    "user": "bold blue",
-                    "assistant": "bold green",
-                    "system": "bold yellow",
-                    "tool": "bold magenta",
-                }.get(message.role, "white")
+                role_style = _ROLE_STYLES.get(message.role, "white")
 
                 console.print(f"\n[{role_style}]{message.role.upper()}[/{role_style}]")
 
                 for part in message.parts:
                     if isinstance(part, TextPart):
-                        console.print(part.content)
+                        # Session text is untrusted: don't interpret "[...]" as markup
+                        console.print(part.content, markup=False, highlight=False)
                     elif isinstance(part, ToolCallPart):
                         console.print(f"[dim]→ Tool Call:[/dim] [cyan]{part.tool_name}[/cyan]")
                         if part.input:
-                            if isinstance(part.input, str):
-                                console.print(
-                                    f"  [dim]{part.input[:200]}...[/dim]"
-                                    if len(str(part.input)) > 200
-                                    else f"  [dim]{part.input}[/dim]"
-                                )
+                            text = part.input if isinstance(part.input, str) else str(part.input)
+                            preview = f"{text[:200]}..." if len(text) > 200 else text
+                            console.print(
+                                f"  {preview}", style="dim", markup=False, highlight=False
+                            )
                     elif isinstance(part, ToolResultPart):
                         status = "[red]error[/red]" if part.is_error else "[green]success[/green]"
                         console.print(f"[dim]← Tool Result ({status}):[/dim]")
-                        output_preview = (
-                            part.output[:500] if len(part.output) > 500 else part.output
-                        )
-                        console.print(Syntax(output_preview, "text", line_numbers=False))
+                        # Plain text needs no lexer; print it verbatim like TextPart
+                        console.print(part.output[:500], markup=False, highlight=False)
 
 
 @click.group()
@@ -282,6 +351,58 @@ def cli() -> None:
     pass
 
 
+def _collect_from_adapter(
+    adapter: SessionAdapter,
+    since: datetime | None,
+    known_ids: set[str],
+    results: queue.Queue[tuple[str, SessionAdapter, Any]],
+    stop: threading.Event,
+) -> None:
+    """Parse the sessions an adapter has that are not yet stored.
+
+    Runs in a worker thread, so it must not touch the store. Progress is put on
+    ``results`` as ``(kind, adapter, payload)`` events: ``"start"``, then one
+    ``"session"`` per parsed session and one ``"failure"`` per ``(ref id, error)``,
+    and finally ``"done"`` or ``"error"`` with the exception that aborted the scan.
+
+    Args:
+        adapter: Adapter to collect from.
+        since: Only consider sessions updated after this time.
+        known_ids: Source IDs already imported for this adapter.
+        results: Bounded queue the collecting thread drains.
+        stop: Set by the collecting thread to abandon the scan.
+    """
+
+    def put(kind: str, payload: Any = None) -> bool:
+        # Wait for room in the queue, but give up once the collector has stopped
+        while not stop.is_set():
+            try:
+                results.put((kind, adapter, payload), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    if not put("start"):
+        return
+    try:
+        for ref in adapter.list_sessions(since=since):
+            if ref.id in known_ids:
+                continue
+            try:
+                session = adapter.parse_session(ref)
+            except Exception as e:
+                sent = put("failure", (ref.id, e))
+            else:
+                sent = put("session", session)
+            if not sent:
+                return
+    except Exception as e:
+        put("error", e)
+    else:
+        put("done")
+
+
 @cli.command()
 @click.option("--source", "-s", type=str, help="Collect from specific source only")
 @click.option("--since", type=str, help="Only sessions from last N days (e.g., 7d, 2w)")
@@ -303,6 +424,8 @@ def collect(source: str | None, since: str | None) -> None:
         sys.exit(1)
 
     try:
+        from sagg.adapters import registry
+
         if source:
             try:
                 adapter = registry.get_adapter(source)
@@ -317,37 +440,72 @@ def collect(source: str | None, since: str | None) -> None:
             console.print("[yellow]No available adapters found.[/yellow]")
             return
 
-        total_collected = 0
+        available = []
         for adapter in adapters:
-            if not adapter.is_available():
+            if adapter.is_available():
+                available.append(adapter)
+            else:
                 console.print(f"[dim]Skipping {adapter.display_name} (not available)[/dim]")
-                continue
 
-            console.print(f"[bold]Collecting from {adapter.display_name}...[/bold]")
-
-            try:
-                refs = adapter.list_sessions(since=since_dt)
-                collected = 0
-
-                for ref in refs:
-                    # Check if already imported
-                    if store.session_exists(adapter.name, ref.id):
-                        continue
-
-                    try:
-                        session = adapter.parse_session(ref)
-                        store.save_session(session)
-                        collected += 1
-                    except Exception as e:
-                        error_console.print(
-                            f"[yellow]Warning: Failed to parse session {ref.id}: {e}[/yellow]"
-                        )
-
-                console.print(f"  Collected {collected} new session(s)")
-                total_collected += collected
-
-            except Exception as e:
-                error_console.print(f"[red]Error collecting from {adapter.display_name}:[/red] {e}")
+        total_collected = 0
+        if available:
+            from concurrent.futures import ThreadPoolExecutor
+
+            # Adapters are independent and I/O-bound, so scan and parse them
+            # concurrently. Parsed sessions are handed back through a bounded
+            # queue and saved as they arrive; the store is only touched here.
+            results: queue.Queue[tuple[str, SessionAdapter, Any]] = queue.Queue(maxsize=32)
+            stop = threading.Event()
+            counts = dict.fromkeys(available, 0)
+            # Read every known-ID set before starting workers, so a store error
+            # can't leave a worker blocked on a queue nobody drains
+            known_ids = {adapter: store.get_source_ids(adapter.name) for adapter in available}
+            with ThreadPoolExecutor(max_workers=len(available)) as executor:
+                for adapter in available:
+                    executor.submit(
+                        _collect_from_adapter,
+                        adapter,
+                        since_dt,
+                        known_ids[adapter],
+                        results,
+                        stop,
+                    )
+                try:
+                    pending = len(available)
+                    while pending:
+                        kind, adapter, payload = results.get()
+                        if kind == "session":
+                            try:
+                                store.save_session(payload)
+                            except Exception as e:
+                                error_console.print(
+                                    f"[yellow]Warning: Failed to parse session "
+                                    f"{payload.source_id}: {e}[/yellow]"
+                                )
+                            else:
+                                counts[adapter] += 1
+                        elif kind == "start":
+                            console.print(f"[bold]Collecting from {adapter.display_name}...[/bold]")
+                        elif kind == "failure":
+                            ref_id, err = payload
+                            error_console.print(
+                                f"[yellow]Warning: Failed to parse session {ref_id}: {err}[/yellow]"
+                            )
+                        else:
+                            pending -= 1
+                            if kind == "error":
+                                error_console.print(
+                                    f"[red]Error collecting from {adapter.display_name}:[/red] "
+                                    f"{payload}"
+                                )
+                            console.print(
+                                f"  Collected {counts[adapter]} new session(s) "
+                                f"from {adapter.display_name}"
+                            )
+                finally:
+                    # Release workers blocked on a full queue if we stop early
+                    stop.set()
+            total_collected = sum(counts.values())
 
         console.print(f"\n[bold green]Total: {total_collected} session(s) collected[/bold green]")
 
@@ -359,19 +517,11 @@ def collect(source: str | None, since: str | None) -> None:
 @click.option("--source", "-s", type=str, help="Filter by source")
 @click.option("--project", "-p", type=str, help="Filter by project name")
 @click.option("--limit", "-l", type=int, default=20, help="Limit results")
-def list_sessions(source: str | None, project: str | None, limit: int) -> None:
+@with_store
+def list_sessions(store: SessionStore, source: str | None, project: str | None, limit: int) -> None:
     """List recent sessions."""
-    try:
-        store = SessionStore()
-    except Exception as e:
-        error_console.print(f"[red]Error initializing store:[/red] {e}")
-        sys.exit(1)
-
-    try:
-        sessions = store.list_sessions(source=source, project=project, limit=limit)
-        print_sessions_table(sessions)
-    finally:
-        store.close()
+    sessions = store.list_session_summaries(source=source, project=project, limit=limit)
+    print_sessions_table(sessions)
 
 
 @cli.command()
@@ -402,38 +552,68 @@ def search(query: str, limit: int) -> None:
 @cli.command()
 @click.argument("session_id")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
-def show(session_id: str, as_json: bool) -> None:
+@with_store
+def show(store: SessionStore, session_id: str, as_json: bool) -> None:
     """Show session details."""
-    try:
-        store = SessionStore()
-    except Exception as e:
-        error_console.print(f"[red]Error initializing store:[/red] {e}")
+    session = store.get_session(session_id)
+    if session is None:
+        # Try partial ID match
+        matches = store.find_by_id_prefix(session_id)
+        if len(matches) == 1:
+            session = store.get_session(matches[0])
+        elif len(matches) > 1:
+            error_console.print(
+                f"[red]Error:[/red] Ambiguous session ID. Multiple matches found:"
+            )
+            for match_id in matches:
+                error_console.print(f"  • {match_id}")
+            sys.exit(1)
+
+    if session is None:
+        error_console.print(f"[red]Error:[/red] Session '{session_id}' not found")
         sys.exit(1)
 
-    try:
-        session = store.get_session(session_id)
-        if session is None:
-            # Try partial ID match
-            sessions = store.list_sessions(limit=100)
-            matches = [s for s in sessions if s.id.startswith(session_id)]
-            if len(matches) == 1:
-                session = store.get_session(matches[0].id)
-            elif len(matches) > 1:
-                error_console.print(
-                    f"[red]Error:[/red] Ambiguous session ID. Multiple matches found:"
-                )
-                for s in matches[:5]:
-                    error_console.print(f"  • {s.id}")
-                sys.exit(1)
+    print_session_detail(session, as_json=as_json)
 
-        if session is None:
-            error_console.print(f"[red]Error:[/red] Session '{session_id}' not found")
-            sys.exit(1)
 
-        print_session_detail(session, as_json=as_json)
+def _write_chunks(out: TextIO, chunks: Iterable[str], start: str, sep: str, end: str) -> int:
+    """Write chunks to a stream as they are produced, with framing around them.
 
-    finally:
-        store.close()
+    Args:
+        out: Text stream to write to.
+        chunks: Pieces to write, in order.
+        start: Text written before the first chunk.
+        sep: Text written between chunks.
+        end: Text written after the last chunk.
+
+    Returns:
+        Number of chunks written.
+    """
+    count = 0
+    out.write(start)
+    for chunk in chunks:
+        if count:
+            out.write(sep)
+        out.write(chunk)
+        count += 1
+    out.write(end)
+    return count
+
+
+def _scrub_session(scrubber: DataScrubber, session: UnifiedSession) -> UnifiedSession:
+    """Return a copy of a session with sensitive strings scrubbed.
+
+    Scrubs the dumped field values directly and re-validates once, rather
+    than round-tripping the whole session through a JSON string.
+
+    Args:
+        scrubber: Scrubber to apply.
+        session: Session to scrub.
+
+    Returns:
+        Scrubbed session.
+    """
+    return type(session).model_validate(scrubber.scrub_object(session.model_dump(mode="json")))
 
 
 @cli.command()
@@ -483,76 +663,48 @@ def export(
 
     try:
         if export_all:
-            sessions = store.list_sessions(limit=10000)
-            if not sessions:
+            # Sessions are streamed with their content rather than loaded up front
+            sessions = store.iter_sessions_full(limit=10000)
+            first = next(sessions, None)
+            if first is None:
                 console.print("[dim]No sessions to export.[/dim]")
                 return
-
-            # Apply scrubbing to all sessions if requested
+            sessions = chain((first,), sessions)
             if scrubber:
-                # We need to deeply scrub the session objects.
-                # Since models are immutable/pydantic, simplest way is to dump to dict, scrub, then re-validate
-                # OR just scrub the output string if it's JSON/Markdown.
-                # However, for structured export (list of dicts), scrubbing the dicts is better.
-                pass  # We'll handle this per-item below
+                sessions = (_scrub_session(scrubber, s) for s in sessions)
 
             if format == "markdown":
                 # Markdown export for multiple sessions is tricky (one huge file?)
-                # We'll separate them with horizontal rules
+                # We'll separate them with blank lines
                 from sagg.export.markdown import MarkdownExporter
 
-                exporter = MarkdownExporter()
-                parts = []
-                for s in sessions:
-                    s_data = s
-                    if scrubber:
-                        # Scrubbing logic for object access is complex without serialization
-                        # For now, let's serialize -> scrub -> deserialize or just scrub text output
-                        # Strategy: Serialize to JSON, scrub, deserialize back
-                        s_json = s.model_dump_json()
-                        s_scrubbed_json = scrubber.scrub(s_json)
-                        s_data = s.model_validate_json(s_scrubbed_json)
-
-                    parts.append(exporter.export_session(s_data))
-
-                output_content = "\n\n".join(parts)
-
-            elif format == "agenttrace":
-                from sagg.export import AgentTraceExporter
+                md_exporter = MarkdownExporter()
+                chunks = (md_exporter.export_session(s) for s in sessions)
+                framing = ("", "\n\n", "")
 
-                exporter = AgentTraceExporter()
-                export_data = []
-                for s in sessions:
-                    s_data = s
-                    if scrubber:
-                        s_json = s.model_dump_json()
-                        s_scrubbed_json = scrubber.scrub(s_json)
-                        s_data = s.model_validate_json(s_scrubbed_json)
-
-                    export_data.append(exporter.export_session(s_data).model_dump(mode="json"))
-
-                import json
-
-                output_content = json.dumps(export_data, indent=2)
-
-            else:  # json
-                import json
+            else:
+                records: Iterable[AgentTraceRecord | UnifiedSession]
+                if format == "agenttrace":
+                    from sagg.export import AgentTraceExporter
 
-                export_data = []
-                for s in sessions:
-                    data = s.model_dump(mode="json")
-                    if scrubber:
-                        data = scrubber.scrub_object(data)
-                    export_data.append(data)
+                    trace_exporter = AgentTraceExporter()
+                    records = trace_exporter.export_sessions(sessions)
+                else:  # json
+                    records = sessions
 
-                output_content = json.dumps(export_data, indent=2)
+                # pydantic serializes straight to JSON without an intermediate dict;
+                # each element is indented to sit inside the surrounding array
+                chunks = ("  " + r.model_dump_json(indent=2).replace("\n", "\n  ") for r in records)
+                framing = ("[\n", ",\n", "\n]")
 
+            # Sessions are written as they are produced rather than staged in memory
             if output:
-                with open(output, "w") as f:
-                    f.write(output_content)
-                console.print(f"[green]Exported {len(sessions)} session(s) to {output}[/green]")
+                with open(output, "w", encoding="utf-8") as f:
+                    exported = _write_chunks(f, chunks, *framing)
+                console.print(f"[green]Exported {exported} session(s) to {output}[/green]")
             else:
-                console.print(output_content)
+                _write_chunks(sys.stdout, chunks, *framing)
+                sys.stdout.write("\n")
 
         else:
             # Single session export
@@ -560,29 +712,24 @@ def export(
             session = store.get_session(session_id)  # type: ignore[arg-type]
             if session is None:
                 # Try partial ID match
-                sessions = store.list_sessions(limit=1000)
-                matches = [s for s in sessions if s.id.startswith(session_id)]  # type: ignore[arg-type]
+                matches = store.find_by_id_prefix(session_id)  # type: ignore[arg-type]
                 if len(matches) == 1:
-                    session = store.get_session(matches[0].id)
+                    session = store.get_session(matches[0])
                 elif len(matches) > 1:
                     error_console.print(
                         f"[red]Error:[/red] Ambiguous session ID. Multiple matches found:"
                     )
-                    for s in matches[:5]:
-                        error_console.print(f"  - {s.id}")
+                    for match_id in matches:
+                        error_console.print(f"  - {match_id}")
                     sys.exit(1)
 
             if session is None:
                 error_console.print(f"[red]Error:[/red] Session '{session_id}' not found")
                 sys.exit(1)
 
-            # Scrubbing for single session
-            if scrubber:
-                # Serialize -> Scrub -> Deserialize
-                s_json = session.model_dump_json()
-                s_scrubbed_json = scrubber.scrub(s_json)
-                # Re-validate to ensure integrity, or just use the JSON if output is JSON
-                session = session.model_validate_json(s_scrubbed_json)
+            # Scrubbing for single session (JSON scrubs the dump directly below)
+            if scrubber and format != "json":
+                session = _scrub_session(scrubber, session)
 
             if format == "markdown":
                 from sagg.export.markdown import MarkdownExporter
@@ -600,11 +747,16 @@ def export(
                 record = exporter.export_session(session)
                 output_content = record.model_dump_json(indent=2)
 
+            elif scrubber:  # json
+                # The scrubbed dump is already the output; no need to rebuild a model
+                scrubbed = scrubber.scrub_object(session.model_dump(mode="json"))
+                output_content = json.dumps(scrubbed, indent=2, ensure_ascii=False)
+
             else:  # json
                 output_content = session.model_dump_json(indent=2)
 
             if output:
-                with open(output, "w") as f:
+                with open(output, "w", encoding="utf-8") as f:
                     f.write(output_content)
                 console.print(f"[green]Exported session to {output} ({format})[/green]")
             else:
@@ -618,81 +770,72 @@ def export(
 @click.option(
     "--by", "group_by", type=click.Choice(["model", "source"]), help="Group statistics by"
 )
-def stats(group_by: str | None) -> None:
+@with_store
+def stats(store: SessionStore, group_by: str | None) -> None:
     """Show usage statistics."""
-    try:
-        store = SessionStore()
-    except Exception as e:
-        error_console.print(f"[red]Error initializing store:[/red] {e}")
-        sys.exit(1)
+    stats_data = store.get_stats()
 
-    try:
-        stats_data = store.get_stats()
-
-        # Summary panel
-        summary = f"""[bold]Total Sessions:[/bold] {stats_data["total_sessions"]:,}
+    # Summary panel
+    summary = f"""[bold]Total Sessions:[/bold] {stats_data["total_sessions"]:,}
 [bold]Total Turns:[/bold] {stats_data["total_turns"]:,}
 [bold]Total Tokens:[/bold] {stats_data["total_tokens"]:,}
   [dim]Input:[/dim] {stats_data["total_input_tokens"]:,}
   [dim]Output:[/dim] {stats_data["total_output_tokens"]:,}"""
 
-        console.print(Panel(summary, title="Summary", border_style="blue"))
-
-        if group_by == "source" or group_by is None:
-            # Sessions by source
-            if stats_data["sessions_by_source"]:
-                source_table = Table(show_header=True, header_style="bold")
-                source_table.add_column("Source")
-                source_table.add_column("Sessions", justify="right")
+    console.print(Panel(summary, title="Summary", border_style="blue"))
 
-                for source_name, count in sorted(
-                    stats_data["sessions_by_source"].items(),
-                    key=lambda x: x[1],
-                    reverse=True,
-                ):
-                    source_table.add_row(source_name, str(count))
+    if group_by == "source" or group_by is None:
+        # Sessions by source
+        if stats_data["sessions_by_source"]:
+            source_table = Table(show_header=True, header_style="bold")
+            source_table.add_column("Source")
+            source_table.add_column("Sessions", justify="right")
 
-                console.print(
-                    Panel(source_table, title="Sessions by Source", border_style="magenta")
-                )
+            for source_name, count in sorted(
+                stats_data["sessions_by_source"].items(),
+                key=lambda x: x[1],
+                reverse=True,
+            ):
+                source_table.add_row(source_name, str(count))
 
-        if group_by == "model" or group_by is None:
-            # Models used
-            if stats_data["models_used"]:
-                model_table = Table(show_header=True, header_style="bold")
-                model_table.add_column("Model")
-                model_table.add_column("Provider")
-                model_table.add_column("Messages", justify="right")
-                model_table.add_column("Tokens", justify="right")
-
-                for model in stats_data["models_used"][:10]:
-                    total_tokens = model["input_tokens"] + model["output_tokens"]
-                    model_table.add_row(
-                        model["model_id"],
-                        model["provider"] or "[dim]—[/dim]",
-                        str(model["message_count"]),
-                        f"{total_tokens:,}",
-                    )
+            console.print(
+                Panel(source_table, title="Sessions by Source", border_style="magenta")
+            )
 
-                console.print(Panel(model_table, title="Models Used", border_style="green"))
+    if group_by == "model" or group_by is None:
+        # Models used
+        if stats_data["models_used"]:
+            model_table = Table(show_header=True, header_style="bold")
+            model_table.add_column("Model")
+            model_table.add_column("Provider")
+            model_table.add_column("Messages", justify="right")
+            model_table.add_column("Tokens", justify="right")
+
+            for model in stats_data["models_used"][:10]:
+                total_tokens = model["input_tokens"] + model["output_tokens"]
+                model_table.add_row(
+                    model["model_id"],
+                    model["provider"] or "[dim]—[/dim]",
+                    str(model["message_count"]),
+                    f"{total_tokens:,}",
+                )
 
-        # Tools used
-        if stats_data["tools_used"] and group_by is None:
-            tools_table = Table(show_header=True, header_style="bold")
-            tools_table.add_column("Tool")
-            tools_table.add_column("Calls", justify="right")
+            console.print(Panel(model_table, title="Models Used", border_style="green"))
 
-            for tool_name, count in sorted(
-                stats_data["tools_used"].items(),
-                key=lambda x: x[1],
-                reverse=True,
-            )[:15]:
-                tools_table.add_row(tool_name, f"{count:,}")
+    # Tools used
+    if stats_data["tools_used"] and group_by is None:
+        tools_table = Table(show_header=True, header_style="bold")
+        tools_table.add_column("Tool")
+        tools_table.add_column("Calls", justify="right")
 
-            console.print(Panel(tools_table, title="Top Tools", border_style="yellow"))
+        for tool_name, count in sorted(
+            stats_data["tools_used"].items(),
+            key=lambda x: x[1],
+            reverse=True,
+        )[:15]:
+            tools_table.add_row(tool_name, f"{count:,}")
 
-    finally:
-        store.close()
+        console.print(Panel(tools_table, title="Top Tools", border_style="yellow"))
 
 
 @cli.command()
@@ -708,9 +851,9 @@ def heatmap(weeks: int, metric: str) -> None:
     """Show activity heatmap (GitHub-style contributions)."""
     from sagg.analytics.heatmap import (
         get_activity_by_day,
-        generate_heatmap_data,
+        generate_heatmap_data_with_totals,
         render_heatmap,
-        get_month_labels,
+        render_month_header,
     )
 
     try:
@@ -724,44 +867,27 @@ def heatmap(weeks: int, metric: str) -> None:
         activity = get_activity_by_day(store, weeks=weeks, metric=metric)
 
         # Generate heatmap grid
-        data = generate_heatmap_data(activity, weeks=weeks)
-
-        # Get month labels for header
-        month_labels = get_month_labels(weeks)
+        data, total, active_days = generate_heatmap_data_with_totals(activity, weeks=weeks)
 
-        # Build month header line
-        label_width = 6  # "  Sun " width
-        month_header = " " * label_width
-        prev_pos = 0
-        for pos, label in month_labels:
-            spaces_needed = pos - prev_pos
-            month_header += " " * spaces_needed + label
-            prev_pos = pos + len(label)
+        # Month header line, indented past the "  Sun " labels
+        month_header = render_month_header(weeks, label_width=6)
 
         # Render heatmap
         heatmap_output = render_heatmap(data, legend=True)
 
-        # Calculate summary stats
-        total_sessions = sum(activity.values()) if metric == "sessions" else 0
-        total_tokens = sum(activity.values()) if metric == "tokens" else 0
-        active_days = len(activity)
-
         # Build title
         metric_label = "sessions" if metric == "sessions" else "tokens"
         title = f"Activity Heatmap (last {weeks} weeks, by {metric_label})"
 
-        # Create output with Rich
-        output_lines = [month_header, heatmap_output]
-
         # Add summary
         if metric == "sessions":
-            summary = f"\n  {total_sessions:,} sessions across {active_days} active days"
+            summary = f"\n  {total:,} sessions across {active_days} active days"
         else:
-            summary = f"\n  {total_tokens:,} tokens across {active_days} active days"
-
-        output_lines.append(summary)
+            summary = f"\n  {total:,} tokens across {active_days} active days"
 
-        console.print(Panel("\n".join(output_lines), title=title, border_style="green"))
+        # Plain Text body: the grid has no markup, so skip Rich's markup parser
+        body = Text.assemble(month_header, "\n", heatmap_output, "\n", summary)
+        console.print(Panel(body, title=title, border_style="green"))
 
     finally:
         store.close()
@@ -770,6 +896,8 @@ def heatmap(weeks: int, metric: str) -> None:
 @cli.command()
 def sources() -> None:
     """List configured sources and their availability."""
+    from sagg.adapters import registry
+
     adapters = registry.list_adapters()
 
     if not adapters:
@@ -797,6 +925,29 @@ def sources() -> None:
     console.print(table)
 
 
+def _probe_repo(project_path: Path, start: datetime, end: datetime) -> list[dict[str, Any]] | None:
+    """Check a project path for a git repo and load its commit timeline.
+
+    Args:
+        project_path: Project directory to probe.
+        start: Earliest commit time of interest.
+        end: Latest commit time of interest.
+
+    Returns:
+        The repo's commit timeline, or None if the path is not a git repo.
+    """
+    from sagg.git_utils import is_git_repo, load_commit_timeline
+
+    # is_git_repo() already checks that the path exists
+    if not is_git_repo(project_path):
+        return None
+    return load_commit_timeline(project_path, start, end, verified=True)
+
+
+# How far a commit may be from a session's last update and still be linked to it
+_GIT_LINK_WINDOW_HOURS = 2
+
+
 @cli.command("git-link")
 @click.option("--project", "-p", type=str, help="Filter by project")
 @click.option("--update", "do_update", is_flag=True, help="Update session git info")
@@ -805,7 +956,7 @@ def git_link(project: str | None, do_update: bool, since: str | None) -> None:
     """Associate sessions with git commits by timestamp proximity."""
     from pathlib import Path
 
-    from sagg.git_utils import find_closest_commit, get_repo_info, is_git_repo
+    from sagg.git_utils import closest_commit_in, get_repo_info
     from sagg.models import GitContext
 
     since_dt: datetime | None = None
@@ -824,65 +975,97 @@ def git_link(project: str | None, do_update: bool, since: str | None) -> None:
         sys.exit(1)
 
     try:
-        # Get sessions
-        sessions = store.list_sessions(project=project, limit=500)
-
-        # Filter by since if provided
-        if since_dt:
-            sessions = [s for s in sessions if s.updated_at >= since_dt]
+        # Get the most recently active sessions, filtered by since in SQL
+        sessions = list(islice(store.iter_sessions(project=project, since=since_dt), 500))
 
         if not sessions:
             console.print("[dim]No sessions found.[/dim]")
             return
 
-        # Build table
-        table = Table(show_header=True, header_style="bold")
-        table.add_column("Session", style="cyan", max_width=30)
-        table.add_column("Time", style="yellow")
-        table.add_column("Commit", style="green")
-        table.add_column("Message", style="white", max_width=40)
-
-        updated_count = 0
+        pending_updates: list[tuple[str, GitContext]] = []
+        links: list[tuple[str, str]] = []
 
+        # Sessions cluster by project, so probe each repo only once, loading
+        # just the commits that can fall within the match window of a session.
+        window = timedelta(hours=_GIT_LINK_WINDOW_HOURS)
+        spans: dict[str, tuple[datetime, datetime]] = {}
         for session in sessions:
-            session_title = (session.title or "Untitled")[:30]
-            session_time = format_age(session.updated_at)
+            if session.project_path:
+                first, last = spans.get(session.project_path, (session.updated_at,) * 2)
+                spans[session.project_path] = (
+                    min(first, session.updated_at),
+                    max(last, session.updated_at),
+                )
+
+        # Maps project path -> commit timeline, or None if not a git repo.
+        timeline_cache: dict[str, list[dict[str, Any]] | None] = {}
+        repo_info_cache: dict[str, dict[str, Any] | None] = {}
 
+        # Pass 1: resolve commits (git I/O only)
+        for session in sessions:
             commit_sha = "[dim]---[/dim]"
             commit_msg = "[dim]No project path[/dim]"
 
-            if session.project_path:
-                project_path = Path(session.project_path)
+            path_key = session.project_path
+            if path_key:
+                if path_key not in timeline_cache:
+                    first, last = spans[path_key]
+                    timeline_cache[path_key] = _probe_repo(
+                        Path(path_key), first - window, last + window
+                    )
+                timeline = timeline_cache[path_key]
 
-                if project_path.exists() and is_git_repo(project_path):
-                    commit = find_closest_commit(project_path, session.updated_at)
+                if timeline is not None:
+                    commit = closest_commit_in(
+                        timeline, session.updated_at, window_hours=_GIT_LINK_WINDOW_HOURS
+                    )
 
                     if commit:
                         commit_sha = commit["sha"][:7]
                         commit_msg = (commit["message"] or "")[:40]
 
-                        # Update session if requested
-                        if do_update and commit:
-                            # Get full session and update git context
-                            full_session = store.get_session(session.id)
-                            if full_session:
-                                repo_info = get_repo_info(project_path)
-                                full_session.git = GitContext(
-                                    branch=repo_info["branch"] if repo_info else None,
-                                    commit=commit["sha"],
-                                    remote=repo_info["remote"] if repo_info else None,
+                        # Queue the update; all are written in one transaction
+                        if do_update:
+                            if path_key not in repo_info_cache:
+                                repo_info_cache[path_key] = get_repo_info(Path(path_key))
+                            repo_info = repo_info_cache[path_key]
+                            pending_updates.append(
+                                (
+                                    session.id,
+                                    GitContext(
+                                        branch=repo_info["branch"] if repo_info else None,
+                                        commit=commit["sha"],
+                                        remote=repo_info["remote"] if repo_info else None,
+                                    ),
                                 )
-                                store.save_session(full_session)
-                                updated_count += 1
+                            )
                     else:
                         commit_msg = "[dim]No matching commit[/dim]"
                 else:
                     commit_msg = "[dim]Not a git repo[/dim]"
 
-            table.add_row(session_title, session_time, commit_sha, commit_msg)
+            links.append((commit_sha, commit_msg))
+
+        # Pass 2: format display columns
+        now = datetime.now(timezone.utc)
+        rows = [
+            ((session.title or "Untitled")[:30], format_age(session.updated_at, now), sha, msg)
+            for session, (sha, msg) in zip(sessions, links, strict=True)
+        ]
+
+        # Pass 3: build table
+        table = Table(show_header=True, header_style="bold")
+        table.add_column("Session", style="cyan", max_width=30)
+        table.add_column("Time", style="yellow")
+        table.add_column("Commit", style="green")
+        table.add_column("Message", style="white", max_width=40)
+
+        for row in rows:
+            table.add_row(*row)
 
         console.print(table)
 
+        updated_count = store.update_git_contexts(pending_updates)
         if do_update and updated_count > 0:
             console.print(f"\n[green]Updated git info for {updated_count} session(s)[/green]")
 
@@ -917,54 +1100,42 @@ def summarize(days: int, project: str | None, detailed: bool) -> None:
         sys.exit(1)
 
     since_dt = datetime.now(timezone.utc) - timedelta(days=days)
-    
+
     try:
-        # Fetch sessions (limit to 1000 to be safe)
-        sessions = store.list_sessions(project=project, since=since_dt, limit=1000)
-        
-        if not sessions:
+        # Rows arrive sorted by project and then newest first, so each
+        # project/date block is a run of consecutive rows
+        rows = store.iter_sessions_for_summary(
+            project=project, since=since_dt, files_limit=5 if detailed else 0
+        )
+
+        # Render Markdown into a buffer and print it in one go
+        lines = [f"# Work Summary (Last {days} Days)\n"]
+
+        for proj, proj_rows in groupby(rows, key=itemgetter(0)):
+            lines.append(f"## Project: [cyan]{proj}[/cyan]")
+
+            for date_str, day_rows in groupby(proj_rows, key=itemgetter(1)):
+                lines.append(f"### {date_str}")
+
+                for _, _, title, duration_ms, files_modified, n_files in day_rows:
+                    duration_mins = (duration_ms or 0) // 60000
+                    duration_str = f"{duration_mins}m" if duration_mins > 0 else "<1m"
+
+                    lines.append(f"- **{title or 'Untitled Session'}** ({duration_str})")
+
+                    if files_modified:
+                        files_str = ", ".join(f"`{f}`" for f in files_modified)
+                        if n_files > 5:
+                            files_str += f" and {n_files - 5} more"
+                        lines.append(f"  - Modified: {files_str}")
+
+                lines.append("")  # spacing
+
+        if len(lines) == 1:
             console.print(f"[yellow]No sessions found in the last {days} day(s).[/yellow]")
             return
 
-        # Group by Project -> Date
-        grouped: dict[str, dict[str, list[UnifiedSession]]] = {}
-        
-        for session in sessions:
-            proj = session.project_name or "Unknown Project"
-            date_str = session.updated_at.strftime("%Y-%m-%d")
-            
-            if proj not in grouped:
-                grouped[proj] = {}
-            if date_str not in grouped[proj]:
-                grouped[proj][date_str] = []
-                
-            grouped[proj][date_str].append(session)
-
-        # Render Markdown
-        console.print(f"# Work Summary (Last {days} Days)\n")
-        
-        for proj, dates in sorted(grouped.items()):
-            console.print(f"## Project: [cyan]{proj}[/cyan]")
-            
-            for date_str, sess_list in sorted(dates.items(), reverse=True):
-                console.print(f"### {date_str}")
-                
-                for s in sess_list:
-                    duration_mins = (s.duration_ms or 0) // 60000
-                    duration_str = f"{duration_mins}m" if duration_mins > 0 else "<1m"
-                    
-                    # Heuristic for title if generic
-                    title = s.title or "Untitled Session"
-                    
-                    console.print(f"- **{title}** ({duration_str})")
-                    
-                    if detailed and s.stats.files_modified:
-                        files_str = ", ".join(f"`{f}`" for f in s.stats.files_modified[:5])
-                        if len(s.stats.files_modified) > 5:
-                            files_str += f" and {len(s.stats.files_modified) - 5} more"
-                        console.print(f"  - Modified: {files_str}")
-                
-                console.print("") # spacing
+        console.print("\n".join(lines))
 
     finally:
         store.close()
@@ -1028,46 +1199,40 @@ def similar(query: str | None, session: str | None, top: int) -> None:
 
         console.print(f"\n[bold]{display_title}[/bold]\n")
 
-        # Create a table for results
-        table = Table(
-            show_header=False,
-            box=None,
-            padding=(0, 1),
-            collapse_padding=True,
-        )
-        table.add_column("Rank", style="dim", width=4)
-        table.add_column("Details", style="white")
-
+        # A grid keeps the rank in its own gutter, so long titles wrap under
+        # the details rather than back to the first column
+        grid = Table.grid(padding=(0, 1), pad_edge=True, collapse_padding=True)
+        grid.add_column(style="dim", width=4)
+        grid.add_column()
         for i, result in enumerate(results, 1):
             # Format similarity percentage
             similarity_pct = int(result.score * 100)
-            if similarity_pct >= 70:
-                score_style = "green"
-            elif similarity_pct >= 40:
-                score_style = "yellow"
-            else:
-                score_style = "dim"
+            score_style = _SIMILAR_SCORE_STYLES[(similarity_pct >= 40) + (similarity_pct >= 70)]
 
             # Format matched terms
-            matched_terms_str = ", ".join(result.matched_terms[:5])
-            if len(result.matched_terms) > 5:
-                matched_terms_str += f" (+{len(result.matched_terms) - 5} more)"
+            matched_terms = result.matched_terms
+            n_terms = len(matched_terms)
+            matched_terms_str = ", ".join(matched_terms[:5])
+            if n_terms > 5:
+                matched_terms_str += f" (+{n_terms - 5} more)"
 
             # Build the detail lines
-            title_line = f"[bold]{result.title}[/bold] ([{score_style}]{similarity_pct}% similar[/{score_style}])"
-            project_line = f"[cyan]{result.project}[/cyan] [dim]•[/dim] [dim]{truncate_id(result.session_id, 12)}[/dim]"
-
-            details = f"{title_line}\n{project_line}"
+            details = _SIMILAR_DETAILS_TMPL.format(
+                title=result.title,
+                style=score_style,
+                pct=similarity_pct,
+                project=result.project,
+                session_id=truncate_id(result.session_id, 12),
+            )
             if matched_terms_str:
                 details += f"\n[dim]Matched: {matched_terms_str}[/dim]"
 
-            table.add_row(f"{i}.", details)
+            # Blank row between results
+            if i > 1:
+                grid.add_row()
+            grid.add_row(f"{i}.", details)
 
-            # Add a blank row between results (except after the last one)
-            if i < len(results):
-                table.add_row("", "")
-
-        console.print(table)
+        console.print(grid)
 
     finally:
         store.close()
@@ -1094,7 +1259,7 @@ def oracle(query: str, top: int, verbose: bool) -> None:
         sys.exit(1)
 
     try:
-        from sagg.analytics.oracle import search_history
+        from sagg.analytics.oracle import format_time_ago, search_history
 
         results = search_history(store, query, limit=top)
 
@@ -1102,30 +1267,15 @@ def oracle(query: str, top: int, verbose: bool) -> None:
             console.print(f"[dim]No sessions found matching '{query}'[/dim]")
             return
 
-        from rich.text import Text
-
         console.print(f'[bold]Oracle: "{query}"[/bold]')
         console.print(f"Found {len(results)} relevant session(s):\n")
 
-        for result in results:
-            # Calculate time ago
-            now = datetime.now(timezone.utc)
-            if result.timestamp.tzinfo is None:
-                timestamp = result.timestamp.replace(tzinfo=timezone.utc)
-            else:
-                timestamp = result.timestamp
-
-            delta = now - timestamp
-            seconds = delta.total_seconds()
+        # Collect all panels and render them in a single pass
+        renderables: list[Panel | Text] = []
 
-            if seconds < 3600:
-                time_ago = f"{int(seconds / 60)}m ago"
-            elif seconds < 86400:
-                time_ago = f"{int(seconds / 3600)}h ago"
-            elif seconds < 604800:
-                time_ago = f"{int(seconds / 86400)} days ago"
-            else:
-                time_ago = f"{int(seconds / 604800)} weeks ago"
+        now = datetime.now(timezone.utc)
+        for result in results:
+            time_ago = format_time_ago(result.timestamp, now)
 
             # Format relevance as percentage
             relevance_pct = int(result.relevance_score * 100)
@@ -1147,14 +1297,16 @@ def oracle(query: str, top: int, verbose: bool) -> None:
             # Create panel with title showing relevance
             panel_title = f"Session: {result.title} ({relevance_pct}% match)"
 
-            console.print(
+            renderables.append(
                 Panel(
                     panel_content,
                     title=panel_title,
                     border_style="blue",
                 )
             )
-            console.print()  # Spacing between panels
+            renderables.append(Text())  # Spacing between panels
+
+        console.print(Group(*renderables))
 
     except Exception as e:
         error_console.print(f"[red]Error searching:[/red] {e}")
@@ -1188,6 +1340,8 @@ def sync(source: str | None, watch: bool, dry_run: bool, debounce: int) -> None:
         sys.exit(1)
 
     try:
+        from sagg.adapters import registry
+
         # Get adapters (optionally filtered by source)
         if source:
             try:
@@ -1218,8 +1372,6 @@ def sync(source: str | None, watch: bool, dry_run: bool, debounce: int) -> None:
 
 def _run_sync_once(syncer, source: str | None, dry_run: bool) -> None:
     """Run a one-time sync operation."""
-    from rich.live import Live
-
     mode_label = "[dim](dry run)[/dim] " if dry_run else ""
     console.print(f"{mode_label}[bold]Syncing sessions...[/bold]")
 
@@ -1253,8 +1405,6 @@ def _run_sync_once(syncer, source: str | None, dry_run: bool) -> None:
 
 def _run_watch_mode(syncer, source: str | None, debounce: int, dry_run: bool) -> None:
     """Run continuous watch mode."""
-    from rich.live import Live
-
     mode_label = "[dim](dry run)[/dim] " if dry_run else ""
     console.print(f"{mode_label}[bold]Watching for changes...[/bold] (Ctrl+C to stop)\n")
 
@@ -1265,16 +1415,20 @@ def _run_watch_mode(syncer, source: str | None, debounce: int, dry_run: bool) ->
     console.print()
 
     try:
-        for event in syncer.watch(source=source, debounce_ms=debounce):
-            timestamp = event.timestamp.strftime("%H:%M:%S")
-            if event.new_count > 0:
-                console.print(
-                    f"[dim][{timestamp}][/dim] [green]+[/green] Synced {event.new_count} session(s) from [cyan]{event.source}[/cyan]"
-                )
-            else:
-                console.print(
-                    f"[dim][{timestamp}][/dim] [dim]No new sessions from {event.source}[/dim]"
-                )
+        # Render each debounced batch of events with a single print
+        for batch in syncer.watch_batches(source=source, debounce_ms=debounce):
+            lines = []
+            for event in batch:
+                timestamp = event.timestamp.strftime("%H:%M:%S")
+                if event.new_count > 0:
+                    lines.append(
+                        f"[dim][{timestamp}][/dim] [green]+[/green] Synced {event.new_count} session(s) from [cyan]{event.source}[/cyan]"
+                    )
+                else:
+                    lines.append(
+                        f"[dim][{timestamp}][/dim] [dim]No new sessions from {event.source}[/dim]"
+                    )
+            console.print("\n".join(lines))
     except KeyboardInterrupt:
         console.print("\n[yellow]Watch mode stopped.[/yellow]")
     except ImportError as e:
@@ -1344,15 +1498,7 @@ def bundle_export(output: str, since: str | None, project: str | None, source: s
         if count == 0:
             console.print("[yellow]No sessions to export.[/yellow]")
         else:
-            # Get file size
-            size_bytes = output_path.stat().st_size
-            if size_bytes >= 1024 * 1024:
-                size_str = f"{size_bytes / (1024 * 1024):.1f} MB"
-            elif size_bytes >= 1024:
-                size_str = f"{size_bytes / 1024:.1f} KB"
-            else:
-                size_str = f"{size_bytes} bytes"
-
+            size_str = format_size(output_path.stat().st_size)
             console.print(f"[green]Created:[/green] {output_path} ({size_str})")
             console.print(f"[green]Exported {count} session(s)[/green]")
 
@@ -1468,6 +1614,14 @@ def bundle_verify(bundle_file: str) -> None:
         sys.exit(1)
 
 
+# (label, border style) per friction level, indexed by (score >= 0.3) + (score >= 0.6)
+_FRICTION_SEVERITIES = (
+    ("Low Friction", "dim"),
+    ("Medium Friction", "yellow"),
+    ("High Friction", "red"),
+)
+
+
 @cli.command("friction-points")
 @click.option("--since", type=str, help="Only sessions from last N days (e.g., 7d, 2w)")
 @click.option("--threshold", type=int, default=3, help="Retry threshold for flagging")
@@ -1507,6 +1661,7 @@ def friction_points(since: str | None, threshold: int, top: int) -> None:
             store,
             since=since_dt,
             retry_threshold=threshold,
+            top=top,
         )
 
         if not friction_list:
@@ -1514,28 +1669,19 @@ def friction_points(since: str | None, threshold: int, top: int) -> None:
             console.print(f"[dim]No friction points detected{time_desc}.[/dim]")
             return
 
-        # Limit to top N
-        friction_list = friction_list[:top]
-
         # Build title
         time_desc = f"last {since}" if since else "all time"
         console.print(f"[bold]Friction Points ({time_desc})[/bold]\n")
 
-        # Count by severity
-        high_count = sum(1 for fp in friction_list if fp.friction_score >= 0.6)
-        medium_count = sum(1 for fp in friction_list if 0.3 <= fp.friction_score < 0.6)
+        # Panels are collected and printed as one Group
+        panels: list[RenderableType] = []
+        level_counts = [0, 0, 0]
 
         for fp in friction_list:
             # Determine severity level and color
-            if fp.friction_score >= 0.6:
-                severity = "High Friction"
-                border_color = "red"
-            elif fp.friction_score >= 0.3:
-                severity = "Medium Friction"
-                border_color = "yellow"
-            else:
-                severity = "Low Friction"
-                border_color = "dim"
+            level = (fp.friction_score >= 0.3) + (fp.friction_score >= 0.6)
+            severity, border_color = _FRICTION_SEVERITIES[level]
+            level_counts[level] += 1
 
             # Build panel title
             panel_title = f"{severity}: {fp.title} (score: {fp.friction_score:.2f})"
@@ -1586,20 +1732,23 @@ def friction_points(since: str | None, threshold: int, top: int) -> None:
             elif FrictionType.ERROR_RATE in fp.friction_types:
                 lines.append("[dim]Tip:[/dim] Check command syntax before running")
 
-            console.print(
+            panels.append(
                 Panel(
                     "\n".join(lines),
                     title=panel_title,
                     border_style=border_color,
                 )
             )
-            console.print()  # Spacing between panels
+            panels.append(Text())  # Spacing between panels
 
         # Summary
-        console.print(
-            f"[bold]Summary:[/bold] {high_count} high friction, "
-            f"{medium_count} medium friction session(s) found"
+        panels.append(
+            Text.from_markup(
+                f"[bold]Summary:[/bold] {level_counts[2]} high friction, "
+                f"{level_counts[1]} medium friction session(s) found"
+            )
         )
+        console.print(Group(*panels))
 
     except Exception as e:
         error_console.print(f"[red]Error analyzing sessions:[/red] {e}")
@@ -1658,8 +1807,41 @@ def budget_set(weekly: str | None, daily: str | None) -> None:
         store.close()
 
 
+_BUDGET_BAR_WIDTH = 40
+# Every possible progress bar, indexed by the number of filled cells
+_BUDGET_BARS = tuple(
+    "[" + "=" * filled + " " * (_BUDGET_BAR_WIDTH - filled) + "]"
+    for filled in range(_BUDGET_BAR_WIDTH + 1)
+)
+
+
+_BUDGET_WARNING_PCT = 80
+_BUDGET_CRITICAL_PCT = 95
+
+
+# Budget colour, indexed by _budget_level()
+_BUDGET_COLORS = ("green", "yellow", "red")
+
+
+def _budget_level(percentage: float) -> int:
+    """Get the budget alert level: 0 normal, 1 warning, 2 critical."""
+    return (percentage >= _BUDGET_WARNING_PCT) + (percentage >= _BUDGET_CRITICAL_PCT)
+
+
+@lru_cache(maxsize=256)
+def _format_budget_tokens(tokens: int) -> str:
+    """Format token count for budget display (e.g. 1.5M, 250.0k)."""
+    if tokens >= 1000000:
+        return f"{tokens / 1000000:.1f}M"
+    elif tokens >= 1000:
+        return f"{tokens / 1000:.1f}k"
+    else:
+        return str(tokens)
+
+
 @budget.command("show")
-def budget_show() -> None:
+@with_store
+def budget_show(store: SessionStore) -> None:
     """Show current budget usage.
 
     Displays progress bars showing token usage vs. budget with color coding:
@@ -1667,118 +1849,63 @@ def budget_show() -> None:
     - Yellow: 80-95% usage (warning)
     - Red: Above 95% usage (critical)
     """
-    from rich.progress import BarColumn, Progress, TaskID, TextColumn
-
-    try:
-        store = SessionStore()
-    except Exception as e:
-        error_console.print(f"[red]Error initializing store:[/red] {e}")
-        sys.exit(1)
-
-    try:
-        daily_budget = store.get_budget("daily")
-        weekly_budget = store.get_budget("weekly")
-
-        if daily_budget is None and weekly_budget is None:
-            console.print("[dim]No budgets set.[/dim]")
-            console.print("\nSet budgets with:")
-            console.print("  sagg budget set --daily 100k")
-            console.print("  sagg budget set --weekly 500k")
-            return
+    daily_budget = store.get_budget("daily")
+    weekly_budget = store.get_budget("weekly")
+
+    if daily_budget is None and weekly_budget is None:
+        console.print("[dim]No budgets set.[/dim]")
+        console.print("\nSet budgets with:")
+        console.print("  sagg budget set --daily 100k")
+        console.print("  sagg budget set --weekly 500k")
+        return
 
-        console.print("[bold]Token Budget Status[/bold]\n")
+    # Whole report is buffered and printed once
+    lines = ["[bold]Token Budget Status[/bold]\n"]
 
-        def get_color(percentage: float) -> str:
-            """Get color based on usage percentage."""
-            if percentage >= 95:
-                return "red"
-            elif percentage >= 80:
-                return "yellow"
-            else:
-                return "green"
-
-        def format_tokens(tokens: int) -> str:
-            """Format token count for display."""
-            if tokens >= 1000000:
-                return f"{tokens / 1000000:.1f}M"
-            elif tokens >= 1000:
-                return f"{tokens / 1000:.1f}k"
-            else:
-                return str(tokens)
+    # Both periods' usage in one query
+    usage = store.get_usage_multi(["daily", "weekly"])
 
-        if daily_budget is not None:
-            daily_usage = store.get_usage_for_period("daily")
-            daily_pct = (daily_usage / daily_budget) * 100 if daily_budget > 0 else 0
-            color = get_color(daily_pct)
+    alerts = []
+    for label, period, limit in (
+        ("Daily", "daily", daily_budget),
+        ("Weekly", "weekly", weekly_budget),
+    ):
+        if limit is None:
+            continue
 
-            # Build visual progress bar
-            bar_width = 40
-            filled = int((daily_pct / 100) * bar_width)
-            filled = min(filled, bar_width)  # Cap at 100%
-            bar = "[" + "=" * filled + " " * (bar_width - filled) + "]"
+        used = usage[period]
+        pct = (used / limit) * 100 if limit > 0 else 0
+        level = _budget_level(pct)
+        color = _BUDGET_COLORS[level]
 
-            console.print(f"[bold]Daily Budget[/bold]")
-            console.print(
-                f"  [{color}]{bar}[/{color}] "
-                f"[{color}]{daily_pct:.1f}%[/{color}]"
-            )
-            console.print(
-                f"  [dim]Used:[/dim] {format_tokens(daily_usage)} / {format_tokens(daily_budget)}"
-            )
-            console.print()
+        # Visual progress bar, capped at 100%
+        bar = _BUDGET_BARS[min(int((pct / 100) * _BUDGET_BAR_WIDTH), _BUDGET_BAR_WIDTH)]
 
-        if weekly_budget is not None:
-            weekly_usage = store.get_usage_for_period("weekly")
-            weekly_pct = (weekly_usage / weekly_budget) * 100 if weekly_budget > 0 else 0
-            color = get_color(weekly_pct)
+        lines.append(f"[bold]{label} Budget[/bold]")
+        lines.append(f"  [{color}]{bar}[/{color}] [{color}]{pct:.1f}%[/{color}]")
+        lines.append(
+            f"  [dim]Used:[/dim] {_format_budget_tokens(used)} / {_format_budget_tokens(limit)}"
+        )
+        lines.append("")
 
-            # Build visual progress bar
-            bar_width = 40
-            filled = int((weekly_pct / 100) * bar_width)
-            filled = min(filled, bar_width)  # Cap at 100%
-            bar = "[" + "=" * filled + " " * (bar_width - filled) + "]"
+        # Collect alerts if approaching limits
+        if level == 2:
+            alerts.append(f"[red]! {label} budget nearly exhausted[/red]")
+        elif level == 1:
+            alerts.append(f"[yellow]! Approaching {period} budget limit[/yellow]")
 
-            console.print(f"[bold]Weekly Budget[/bold]")
-            console.print(
-                f"  [{color}]{bar}[/{color}] "
-                f"[{color}]{weekly_pct:.1f}%[/{color}]"
-            )
-            console.print(
-                f"  [dim]Used:[/dim] {format_tokens(weekly_usage)} / {format_tokens(weekly_budget)}"
-            )
-            console.print()
+    if alerts:
+        lines.append("[bold]Alerts[/bold]")
+        lines.extend(f"  {alert}" for alert in alerts)
 
-        # Show alerts if approaching limits
-        alerts = []
-        if daily_budget is not None:
-            daily_usage = store.get_usage_for_period("daily")
-            daily_pct = (daily_usage / daily_budget) * 100 if daily_budget > 0 else 0
-            if daily_pct >= 95:
-                alerts.append("[red]! Daily budget nearly exhausted[/red]")
-            elif daily_pct >= 80:
-                alerts.append("[yellow]! Approaching daily budget limit[/yellow]")
-
-        if weekly_budget is not None:
-            weekly_usage = store.get_usage_for_period("weekly")
-            weekly_pct = (weekly_usage / weekly_budget) * 100 if weekly_budget > 0 else 0
-            if weekly_pct >= 95:
-                alerts.append("[red]! Weekly budget nearly exhausted[/red]")
-            elif weekly_pct >= 80:
-                alerts.append("[yellow]! Approaching weekly budget limit[/yellow]")
-
-        if alerts:
-            console.print("[bold]Alerts[/bold]")
-            for alert in alerts:
-                console.print(f"  {alert}")
-
-    finally:
-        store.close()
+    console.print("\n".join(lines))
 
 
 @budget.command("clear")
 @click.option("--weekly", is_flag=True, help="Clear weekly budget")
 @click.option("--daily", is_flag=True, help="Clear daily budget")
-def budget_clear(weekly: bool, daily: bool) -> None:
+@with_store
+def budget_clear(store: SessionStore, weekly: bool, daily: bool) -> None:
     """Clear token budgets.
 
     If no flags specified, clears all budgets.
@@ -1788,28 +1915,155 @@ def budget_clear(weekly: bool, daily: bool) -> None:
         sagg budget clear --daily  # Clear daily only
         sagg budget clear --weekly # Clear weekly only
     """
+    # If neither flag specified, clear both
+    if not weekly and not daily:
+        weekly = True
+        daily = True
+
+    if daily:
+        store.clear_budget("daily")
+        console.print("[green]Cleared daily budget[/green]")
+
+    if weekly:
+        store.clear_budget("weekly")
+        console.print("[green]Cleared weekly budget[/green]")
+
+
+def _save_facets(
+    store: SessionStore, facets: list[dict[str, Any]]
+) -> tuple[list[dict[str, Any]], int]:
+    """Persist facets in one transaction, isolating bad rows on failure.
+
+    Args:
+        store: Store to write to.
+        facets: Facet dictionaries to upsert.
+
+    Returns:
+        Tuple of (facets that were saved, number that failed).
+    """
     try:
-        store = SessionStore()
+        store.upsert_facets_bulk(facets)
+        return facets, 0
+    except Exception:
+        # Fall back to row-by-row so one bad facet doesn't drop the batch
+        saved: list[dict[str, Any]] = []
+        failed = 0
+        for facet_data in facets:
+            try:
+                store.upsert_facet(facet_data)
+                saved.append(facet_data)
+            except Exception:
+                failed += 1
+        return saved, failed
+
+
+def _analyze_llm_chunk(
+    chunk: list[UnifiedSession], backend: str | None, verbose: bool
+) -> tuple[list[dict[str, Any]], int]:
+    """Analyze a chunk of sessions with one LLM call, falling back per session.
+
+    Safe to run from a worker thread: it only talks to the LLM CLI and
+    never touches the store.
+
+    Args:
+        chunk: Full sessions to analyze.
+        backend: LLM CLI backend name.
+        verbose: Whether to report failures.
+
+    Returns:
+        Tuple of (facet dictionaries, number of sessions that failed).
+    """
+    from sagg.analytics.insights.cli_llm import analyze_session_llm, analyze_sessions_llm_batch
+
+    try:
+        return analyze_sessions_llm_batch(chunk, backend_name=backend), 0
     except Exception as e:
-        error_console.print(f"[red]Error initializing store:[/red] {e}")
-        sys.exit(1)
+        if verbose:
+            error_console.print(f"  [yellow]![/yellow] Batch failed ({len(chunk)} sessions): {e}")
+            error_console.print("  [dim]Falling back to per-session LLM calls for this batch[/dim]")
+
+    facets: list[dict[str, Any]] = []
+    errors = 0
+    for single_session in chunk:
+        try:
+            facets.append(analyze_session_llm(single_session, backend_name=backend))
+        except Exception as single_err:
+            errors += 1
+            if verbose:
+                error_console.print(f"  [red]![/red] Failed: {single_session.id[:12]} - {single_err}")
+    return facets, errors
+
+
+def _load_full_sessions(
+    store: SessionStore, session_ids: list[str], verbose: bool
+) -> tuple[dict[str, UnifiedSession], int]:
+    """Load sessions with content, skipping any whose content can't be read.
 
+    Args:
+        store: Store to load from.
+        session_ids: Session IDs to load.
+        verbose: Print a line for each session that fails to load.
+
+    Returns:
+        Tuple of (session ID -> full session, number of sessions that failed).
+    """
     try:
-        # If neither flag specified, clear both
-        if not weekly and not daily:
-            weekly = True
-            daily = True
+        return store.get_sessions_by_ids(session_ids), 0
+    except Exception:
+        pass
 
-        if daily:
-            store.clear_budget("daily")
-            console.print("[green]Cleared daily budget[/green]")
+    # Some session's content is unreadable; load one at a time to isolate it
+    loaded: dict[str, UnifiedSession] = {}
+    failed = 0
+    for session_id in session_ids:
+        try:
+            full_session = store.get_session(session_id)
+        except Exception as e:
+            failed += 1
+            if verbose:
+                error_console.print(f"  [red]![/red] Failed: {session_id[:12]} - {e}")
+            continue
+        if full_session is not None:
+            loaded[session_id] = full_session
+    return loaded, failed
 
-        if weekly:
-            store.clear_budget("weekly")
-            console.print("[green]Cleared weekly budget[/green]")
 
-    finally:
-        store.close()
+def _heuristic_facet(session: UnifiedSession) -> tuple[dict[str, Any] | None, str | None]:
+    """Run the heuristic analyzer on one session, capturing any failure.
+
+    Defined at module level so it can be shipped to worker processes.
+
+    Args:
+        session: Full session to analyze.
+
+    Returns:
+        Tuple of (facet dictionary, None) on success or (None, error message).
+    """
+    from sagg.analytics.insights.heuristic import analyze_session
+
+    try:
+        return analyze_session(session), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _print_facet_lines(facets: list[dict[str, Any]]) -> None:
+    """Print one summary line per analyzed facet in a single write (verbose mode)."""
+    if not facets:
+        return
+    console.print(
+        "\n".join(
+            f"  [green]+[/green] {facet_data['task_type']:12s} "
+            f"{facet_data['outcome']:20s} "
+            f"friction={facet_data['friction_score']:.2f}  "
+            f"{(facet_data['brief_summary'] or '')[:50]}"
+            for facet_data in facets
+        )
+    )
+
+
+# Most sessions a single analyze-sessions run will pick up
+_ANALYZE_LIMIT = 5000
 
 
 @cli.command("analyze-sessions")
@@ -1824,13 +2078,27 @@ def budget_clear(weekly: bool, daily: bool) -> None:
     help="Analysis method (default: heuristic)",
 )
 @click.option("--llm-cli", type=str, help="Which CLI for LLM (claude, codex, gemini). Auto-detects if omitted.")
-@click.option("--batch-size", type=int, default=10, show_default=True, help="Sessions per LLM call")
+@click.option("--batch-size", type=int, default=10, show_default=True, help="Sessions per LLM call and per facet write")
 @click.option(
     "--resume/--no-resume",
     default=True,
     show_default=True,
     help="With --force --analyzer llm, skip sessions already analyzed in this range",
 )
+@click.option(
+    "--concurrency",
+    type=int,
+    default=4,
+    show_default=True,
+    help="Maximum LLM batches in flight at once",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Processes for heuristic analysis",
+)
 @click.option("--dry-run", is_flag=True, help="Show what would be analyzed")
 @click.option("--verbose", "-v", is_flag=True, help="Show per-session results")
 def analyze_sessions(
@@ -1842,6 +2110,8 @@ def analyze_sessions(
     llm_cli: str | None,
     batch_size: int,
     resume: bool,
+    concurrency: int,
+    workers: int,
     dry_run: bool,
     verbose: bool,
 ) -> None:
@@ -1858,6 +2128,12 @@ def analyze_sessions(
     if batch_size < 1:
         error_console.print("[red]Error:[/red] --batch-size must be >= 1")
         sys.exit(1)
+    if concurrency < 1:
+        error_console.print("[red]Error:[/red] --concurrency must be >= 1")
+        sys.exit(1)
+    if workers < 1:
+        error_console.print("[red]Error:[/red] --workers must be >= 1")
+        sys.exit(1)
 
     try:
         delta = parse_duration(since)
@@ -1873,29 +2149,49 @@ def analyze_sessions(
         sys.exit(1)
 
     try:
+        if dry_run:
+            # Only the preview rows are loaded; the total comes from a COUNT
+            if force:
+                total = store.count_sessions(source=source, project=project, since=since_dt)
+                preview = store.list_sessions(source=source, project=project, since=since_dt, limit=10)
+            else:
+                total = store.count_unfaceted_sessions(since=since_dt, source=source, project=project)
+                preview = store.get_unfaceted_sessions(
+                    since=since_dt,
+                    source=source,
+                    project=project,
+                    limit=10,
+                )
+            total = min(total, _ANALYZE_LIMIT)
+
+            if not total:
+                console.print("[dim]No sessions to analyze.[/dim]")
+                return
+
+            console.print(f"[bold]Would analyze {total} session(s) ({analyzer})[/bold]")
+            for s in preview:
+                console.print(f"  {s.source.value:10s} {(s.title or 'Untitled')[:50]}")
+            if total > len(preview):
+                console.print(f"  [dim]... and {total - len(preview)} more[/dim]")
+            return
+
         # Get sessions to analyze
         if force:
-            sessions = store.list_sessions(source=source, project=project, since=since_dt, limit=5000)
+            sessions = store.list_sessions(
+                source=source, project=project, since=since_dt, limit=_ANALYZE_LIMIT
+            )
         else:
             sessions = store.get_unfaceted_sessions(
                 since=since_dt,
                 source=source,
                 project=project,
-                limit=5000,
+                limit=_ANALYZE_LIMIT,
             )
 
         if not sessions:
             console.print("[dim]No sessions to analyze.[/dim]")
             return
 
-        if dry_run:
-            console.print(f"[bold]Would analyze {len(sessions)} session(s) ({analyzer})[/bold]")
-            for s in sessions[:10]:
-                console.print(f"  {s.source.value:10s} {(s.title or 'Untitled')[:50]}")
-            if len(sessions) > 10:
-                console.print(f"  [dim]... and {len(sessions) - 10} more[/dim]")
-            return
-
         console.print(f"[bold]Analyzing {len(sessions)} session(s) ({analyzer})...[/bold]")
 
         # Check LLM availability if needed
@@ -1918,78 +2214,61 @@ def analyze_sessions(
         errors = 0
 
         if analyzer == "llm":
-            from sagg.analytics.insights.cli_llm import (
-                analyze_session_llm,
-                analyze_sessions_llm_batch,
-                is_session_substantive,
-            )
+            from concurrent.futures import ThreadPoolExecutor, as_completed
+
+            from sagg.analytics.insights.cli_llm import is_session_substantive
 
             completed_ids: set[str] = set()
             if force and resume:
-                existing_facets = store.get_facets(source=source, since=since_dt, project=project, limit=10000)
-                completed_ids = {
-                    f["session_id"]
-                    for f in existing_facets
-                    if f.get("analyzer_version") == "llm_v1"
-                }
+                completed_ids = store.get_completed_facet_ids(
+                    "llm_v1", source=source, since=since_dt, project=project
+                )
                 if completed_ids and verbose:
                     console.print(
                         f"[dim]Resume enabled: skipping {len(completed_ids)} already analyzed sessions[/dim]"
                     )
 
-            llm_sessions = []
-            for session in sessions:
-                if session.id in completed_ids:
-                    skipped_already_analyzed += 1
-                    continue
+            pending_sessions = [s for s in sessions if s.id not in completed_ids]
+            skipped_already_analyzed = len(sessions) - len(pending_sessions)
 
-                full_session = store.get_session(session.id)
+            # Load all candidate sessions with content in a few queries
+            full_sessions, errors = _load_full_sessions(
+                store, [s.id for s in pending_sessions], verbose
+            )
+
+            llm_sessions = []
+            skipped_lines: list[str] = []
+            for session in pending_sessions:
+                full_session = full_sessions.get(session.id)
                 if full_session is None:
                     continue
                 if not is_session_substantive(full_session):
                     skipped_non_substantive += 1
                     if verbose:
-                        console.print(
+                        skipped_lines.append(
                             f"  [dim]-[/dim] skipped non-substantive: {session.id[:12]} "
                             f"{(session.title or 'Untitled')[:50]}"
                         )
                     continue
                 llm_sessions.append(full_session)
-
-            for i in range(0, len(llm_sessions), batch_size):
-                chunk = llm_sessions[i:i + batch_size]
-                try:
-                    facets = analyze_sessions_llm_batch(chunk, backend_name=backend)
-                except Exception as e:
+            if skipped_lines:
+                console.print("\n".join(skipped_lines))
+
+            # LLM calls are I/O bound, so run several batches at once; facets
+            # are written from this thread as each batch completes
+            chunks = [llm_sessions[i:i + batch_size] for i in range(0, len(llm_sessions), batch_size)]
+            with ThreadPoolExecutor(max_workers=min(concurrency, max(len(chunks), 1))) as executor:
+                futures = [
+                    executor.submit(_analyze_llm_chunk, chunk, backend, verbose) for chunk in chunks
+                ]
+                for future in as_completed(futures):
+                    facets, chunk_errors = future.result()
+                    errors += chunk_errors
+                    saved, failed = _save_facets(store, facets)
+                    analyzed += len(saved)
+                    errors += failed
                     if verbose:
-                        error_console.print(
-                            f"  [yellow]![/yellow] Batch failed ({len(chunk)} sessions): {e}"
-                        )
-                        error_console.print("  [dim]Falling back to per-session LLM calls for this batch[/dim]")
-                    facets = []
-                    for single_session in chunk:
-                        try:
-                            facets.append(analyze_session_llm(single_session, backend_name=backend))
-                        except Exception as single_err:
-                            errors += 1
-                            if verbose:
-                                error_console.print(
-                                    f"  [red]![/red] Failed: {single_session.id[:12]} - {single_err}"
-                                )
-
-                for facet_data in facets:
-                    try:
-                        store.upsert_facet(facet_data)
-                        analyzed += 1
-                        if verbose:
-                            console.print(
-                                f"  [green]+[/green] {facet_data['task_type']:12s} "
-                                f"{facet_data['outcome']:20s} "
-                                f"friction={facet_data['friction_score']:.2f}  "
-                                f"{(facet_data['brief_summary'] or '')[:50]}"
-                            )
-                    except Exception:
-                        errors += 1
+                        _print_facet_lines(saved)
 
             console.print(f"\n[bold green]Analyzed {analyzed} session(s)[/bold green]", end="")
             if skipped_already_analyzed:
@@ -2005,37 +2284,44 @@ def analyze_sessions(
                 console.print()
             return
 
-        for session in sessions:
-            try:
-                # Load full session content
-                full_session = store.get_session(session.id)
-                if full_session is None:
-                    continue
+        from concurrent.futures import ProcessPoolExecutor
 
-                if analyzer == "llm":
-                    from sagg.analytics.insights.cli_llm import analyze_session_llm
+        # Full content is loaded and facets written batch_size at a time, one
+        # transaction per batch; analysis itself can fan out across processes
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            for i in range(0, len(sessions), batch_size):
+                chunk = sessions[i:i + batch_size]
+                full_sessions, load_errors = _load_full_sessions(
+                    store, [s.id for s in chunk], verbose
+                )
+                errors += load_errors
+                batch = [full_sessions[s.id] for s in chunk if s.id in full_sessions]
 
-                    facet_data = analyze_session_llm(full_session, backend_name=backend)
+                if pool is not None:
+                    results = pool.map(
+                        _heuristic_facet, batch, chunksize=max(1, len(batch) // (workers * 4))
+                    )
                 else:
-                    from sagg.analytics.insights.heuristic import analyze_session
+                    results = map(_heuristic_facet, batch)
 
-                    facet_data = analyze_session(full_session)
-
-                store.upsert_facet(facet_data)
-                analyzed += 1
-
-                if verbose:
-                    console.print(
-                        f"  [green]+[/green] {facet_data['task_type']:12s} "
-                        f"{facet_data['outcome']:20s} "
-                        f"friction={facet_data['friction_score']:.2f}  "
-                        f"{(facet_data['brief_summary'] or '')[:50]}"
-                    )
+                pending: list[dict[str, Any]] = []
+                for session, (facet_data, error) in zip(batch, results, strict=True):
+                    if facet_data is None:
+                        errors += 1
+                        if verbose:
+                            error_console.print(f"  [red]![/red] Failed: {session.id[:12]} - {error}")
+                        continue
+                    pending.append(facet_data)
 
-            except Exception as e:
-                errors += 1
+                saved, failed = _save_facets(store, pending)
+                analyzed += len(saved)
+                errors += failed
                 if verbose:
-                    error_console.print(f"  [red]![/red] Failed: {session.id[:12]} - {e}")
+                    _print_facet_lines(saved)
+        finally:
+            if pool is not None:
+                pool.shutdown()
 
         console.print(f"\n[bold green]Analyzed {analyzed} session(s)[/bold green]", end="")
         if skipped_non_substantive:
@@ -2122,23 +2408,7 @@ def insights(
         )
 
         # Output
-        if output_format == "json":
-            import json
-
-            json_output = json.dumps(report, indent=2, default=str)
-            if output:
-                with open(output, "w") as f:
-                    f.write(json_output)
-                console.print(f"[green]Report saved to {output}[/green]")
-            else:
-                console.print(json_output)
-
-        elif output_format == "html":
-            console.print("[yellow]HTML export coming soon. Use --format json for now.[/yellow]")
-
-        else:
-            # CLI output
-            _print_insights_cli(report, verbose=verbose)
+        _INSIGHTS_EMITTERS[output_format](report, output=output, verbose=verbose)
 
     finally:
         store.close()
@@ -2158,25 +2428,27 @@ def _print_insights_cli(report: dict, verbose: bool = False) -> None:
     total = report.get("total_facets", 0)
     tools = tool_comp.get("tools_analyzed", [])
 
+    # Build the report as styled Text and print it once, so report content is
+    # never run through the markup parser
+    blank = Text()
+    parts: list[RenderableType] = [blank]
+
     # Header
-    console.print()
-    console.print("[bold]Session Insights[/bold]", end="")
-    console.print(f"  [dim]{total} sessions analyzed[/dim]", end="")
+    header = Text.assemble(("Session Insights", "bold"), (f"  {total} sessions analyzed", "dim"))
     if tools:
         tool_counts = tool_comp.get("sessions_per_tool", {})
         tool_str = " · ".join(f"{t} ({tool_counts.get(t, 0)})" for t in tools)
-        console.print(f"  [dim]{tool_str}[/dim]")
-    else:
-        console.print()
-
-    console.print()
+        header.append(f"  {tool_str}", style="dim")
+    parts += [header, blank]
 
     # At a Glance
     if glance.get("whats_working"):
-        console.print(Panel(
-            f"[bold]Working:[/bold] {glance['whats_working']}\n\n"
-            f"[bold]Hindering:[/bold] {glance.get('whats_hindering', '')}\n\n"
-            f"[bold]Quick win:[/bold] {glance.get('quick_wins', '')}",
+        parts.append(Panel(
+            Text.assemble(
+                ("Working:", "bold"), f" {glance['whats_working']}\n\n",
+                ("Hindering:", "bold"), f" {glance.get('whats_hindering', '')}\n\n",
+                ("Quick win:", "bold"), f" {glance.get('quick_wins', '')}",
+            ),
             title="At a Glance",
             border_style="yellow",
         ))
@@ -2191,92 +2463,137 @@ def _print_insights_cli(report: dict, verbose: bool = False) -> None:
         tool_table.add_column("Friction", justify="right")
         tool_table.add_column("Best For", style="dim")
 
-        best_for = tool_comp.get("best_for", {})
+        # Reverse index of best_for (task -> tool) so each row is a lookup
+        tool_to_tasks: dict[str, list[str]] = defaultdict(list)
+        for task, tool in tool_comp.get("best_for", {}).items():
+            tool_to_tasks[tool].append(task)
 
         for m in metrics:
             tool_name = m["tool"]
-            best_tasks = [t for t, tool in best_for.items() if tool == tool_name]
+            best_tasks = tool_to_tasks.get(tool_name)
             best_str = ", ".join(best_tasks[:2]) if best_tasks else "—"
 
             # Color success rate
-            success_pct = f"{m['success_rate']:.0%}"
             if m["success_rate"] >= 0.8:
-                success_pct = f"[green]{success_pct}[/green]"
+                success_style = "green"
             elif m["success_rate"] >= 0.6:
-                success_pct = f"[yellow]{success_pct}[/yellow]"
+                success_style = "yellow"
             else:
-                success_pct = f"[red]{success_pct}[/red]"
+                success_style = "red"
 
             tool_table.add_row(
-                tool_name,
+                Text(tool_name),
                 str(m["session_count"]),
-                success_pct,
+                Text(f"{m['success_rate']:.0%}", style=success_style),
                 f"{m['avg_friction_score']:.2f}",
-                best_str,
+                Text(best_str),
             )
 
-        console.print(tool_table)
-        console.print()
+        parts += [tool_table, blank]
 
     # Friction
     if friction.get("top_friction_patterns"):
-        console.print("[bold]Top Friction Patterns[/bold]")
+        parts.append(Text("Top Friction Patterns", style="bold"))
         for p in friction["top_friction_patterns"][:5]:
             cat = p["category"].replace("_", " ").title()
-            console.print(f"  [yellow]![/yellow] {cat} ({p['count']}x)")
-        console.print()
+            parts.append(Text.assemble("  ", ("!", "yellow"), f" {cat} ({p['count']}x)"))
+        parts.append(blank)
 
     # Project Areas (verbose only)
     if verbose and areas:
-        console.print("[bold]Project Areas[/bold]")
+        parts.append(Text("Project Areas", style="bold"))
         for area in areas[:5]:
-            console.print(
-                f"  [cyan]{area['name']}[/cyan] ({area['session_count']} sessions, "
-                f"{area['success_rate']:.0%} success)"
-            )
-        console.print()
+            parts.append(Text.assemble(
+                "  ",
+                (area["name"], "cyan"),
+                f" ({area['session_count']} sessions, {area['success_rate']:.0%} success)",
+            ))
+        parts.append(blank)
 
     # Impressive workflows (verbose only)
     if verbose and workflows:
-        console.print("[bold]Impressive Workflows[/bold]")
+        parts.append(Text("Impressive Workflows", style="bold"))
         for w in workflows:
-            console.print(f"  [green]★[/green] {w['title']}")
+            parts.append(Text.assemble("  ", ("★", "green"), f" {w['title']}"))
             if w.get("description"):
-                console.print(f"    [dim]{w['description'][:80]}[/dim]")
-        console.print()
+                parts.append(Text(f"    {w['description'][:80]}", style="dim"))
+        parts.append(blank)
 
     # Suggestions
     agents_md = suggestions.get("agents_md_additions", [])
     if agents_md:
-        console.print("[bold]Suggested AGENTS.md Additions[/bold]")
+        parts.append(Text("Suggested AGENTS.md Additions", style="bold"))
         for s in agents_md[:5]:
-            console.print(f"  [{s['target_file']}] {s['addition'][:80]}")
-            console.print(f"  [dim]Why: {s['why']}[/dim]")
-            console.print()
+            parts.append(Text(f"  [{s['target_file']}] {s['addition'][:80]}"))
+            parts.append(Text(f"  Why: {s['why']}", style="dim"))
+            parts.append(blank)
 
     # Tool recommendations
     recs = suggestions.get("tool_recommendations", [])
     if recs:
-        console.print("[bold]Tool Recommendations[/bold]")
+        parts.append(Text("Tool Recommendations", style="bold"))
         for r in recs[:5]:
-            confidence = f"{'●' * int(r['confidence'] * 5)}{'○' * (5 - int(r['confidence'] * 5))}"
-            console.print(f"  {r['task_type']:20s} → [cyan]{r['recommended_tool']}[/cyan]  [{confidence}]")
-        console.print()
+            dots = int(r["confidence"] * 5)
+            parts.append(Text.assemble(
+                f"  {r['task_type']:20s} → ",
+                (r["recommended_tool"], "cyan"),
+                f"  [{'●' * dots}{'○' * (5 - dots)}]",
+            ))
+        parts.append(blank)
 
     # Trends
-    console.print(
-        f"[dim]Friction trend: {trends.get('friction_trend', 'stable')} · "
-        f"Productivity trend: {trends.get('productivity_trend', 'stable')}[/dim]"
-    )
+    parts.append(Text(
+        f"Friction trend: {trends.get('friction_trend', 'stable')} · "
+        f"Productivity trend: {trends.get('productivity_trend', 'stable')}",
+        style="dim",
+    ))
 
     # Fun ending
     if fun.get("headline"):
-        console.print()
-        console.print(Panel(
-            f"[bold]{fun['headline']}[/bold]\n[dim]{fun.get('detail', '')}[/dim]",
+        parts.append(blank)
+        parts.append(Panel(
+            Text.assemble((fun["headline"], "bold"), "\n", (fun.get("detail", ""), "dim")),
             border_style="yellow",
         ))
 
+    console.print(Group(*parts))
+
+
+def _emit_insights_json(
+    report: dict[str, Any], output: str | None = None, verbose: bool = False
+) -> None:
+    """Write the insights report as JSON to a file or stdout."""
+    # Stream straight to the destination rather than building one big string
+    if output:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+        console.print(f"[green]Report saved to {output}[/green]")
+    else:
+        json.dump(report, sys.stdout, indent=2, default=str)
+        sys.stdout.write("\n")
+
+
+def _emit_insights_html(
+    report: dict[str, Any], output: str | None = None, verbose: bool = False
+) -> None:
+    """Placeholder for the HTML insights report."""
+    console.print("[yellow]HTML export coming soon. Use --format json for now.[/yellow]")
+
+
+def _emit_insights_cli(
+    report: dict[str, Any], output: str | None = None, verbose: bool = False
+) -> None:
+    """Print the insights report to the terminal."""
+    _print_insights_cli(report, verbose=verbose)
+
+
+# Insights report writers, keyed by --format value
+_INSIGHTS_EMITTERS = {
+    "json": _emit_insights_json,
+    "html": _emit_insights_html,
+    "cli": _emit_insights_cli,
+}
+
 
 def main() -> None:
     """Main entry point for the CLI."""
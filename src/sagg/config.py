@@ -136,6 +136,10 @@ def get_default_config() -> Config:
     )
 
 
+# Parsed config files keyed by (path, mtime_ns, size)
+_load_cache: dict[tuple[Path, int, int], Config] = {}
+
+
 def load_config(config_path: Path | None = None) -> Config:
     """Load configuration from a TOML file.
 
@@ -154,9 +158,17 @@ def load_config(config_path: Path | None = None) -> Config:
     # Start with defaults
     default_config = get_default_config()
 
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except OSError:
         return default_config
 
+    # An unchanged file yields the same config, so skip re-parsing it
+    cache_key = (config_path, stat.st_mtime_ns, stat.st_size)
+    cached = _load_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         with config_path.open("rb") as f:
             data = tomllib.load(f)
@@ -165,7 +177,9 @@ def load_config(config_path: Path | None = None) -> Config:
         return default_config
 
     # Merge with defaults
-    return _merge_config(default_config, data)
+    config = _merge_config(default_config, data)
+    _load_cache[cache_key] = config
+    return config
 
 
 def _merge_config(default: Config, data: dict[str, Any]) -> Config:
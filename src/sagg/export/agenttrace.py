@@ -8,9 +8,10 @@ from __future__ import annotations
 
 import json
 import uuid
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -46,6 +47,16 @@ FILE_MODIFICATION_TOOLS = frozenset(
     }
 )
 
+# Tool input keys that may hold the target file path, in priority order
+_PATH_KEYS = ("filePath", "path", "file_path", "file", "filename")
+_PATH_KEY_SET = frozenset(_PATH_KEYS)
+
+# Extensions that mark a bare tool input string as a file path
+_PATH_SUFFIXES = (".py", ".ts", ".js", ".rs")
+
+# Directory names treated as a project root when relativizing absolute paths
+_ROOT_MARKERS = tuple(f"/{name}/" for name in ("src", "lib", "pkg", "app", "tests", "test"))
+
 
 class AgentTraceRange(BaseModel):
     """Line range within a file that was modified."""
@@ -115,6 +126,24 @@ class AgentTraceRecord(BaseModel):
     metadata: AgentTraceMetadata
 
 
+def _path_from_input(input_data: dict[str, Any]) -> str | None:
+    """Return the highest-priority string path parameter in a tool input.
+
+    Args:
+        input_data: Parsed tool call input.
+
+    Returns:
+        The file path if one of the known keys holds a string, None otherwise.
+    """
+    # One set intersection rules out inputs without any path key
+    hits = input_data.keys() & _PATH_KEY_SET
+    if hits:
+        for key in _PATH_KEYS:
+            if key in hits and isinstance(input_data[key], str):
+                return input_data[key]
+    return None
+
+
 class AgentTraceExporter:
     """Exporter for converting UnifiedSession to AgentTrace format.
 
@@ -139,11 +168,14 @@ class AgentTraceExporter:
         self.tool_name = tool_name
         self.tool_version = tool_version
 
-    def export_session(self, session: UnifiedSession) -> AgentTraceRecord:
+    def export_session(
+        self, session: UnifiedSession, *, timestamp: str | None = None
+    ) -> AgentTraceRecord:
         """Convert a UnifiedSession to an AgentTraceRecord.
 
         Args:
             session: The unified session to export.
+            timestamp: RFC 3339 export time. Defaults to the current UTC time.
 
         Returns:
             An AgentTraceRecord representing the session's file contributions.
@@ -175,13 +207,27 @@ class AgentTraceExporter:
         # Create the record
         return AgentTraceRecord(
             id=str(uuid.uuid4()),
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=timestamp or datetime.now(timezone.utc).isoformat(),
             vcs=vcs,
             tool=AgentTraceTool(name=self.tool_name, version=self.tool_version),
             files=files,
             metadata=metadata,
         )
 
+    def export_sessions(self, sessions: Iterable[UnifiedSession]) -> Iterator[AgentTraceRecord]:
+        """Convert sessions to AgentTraceRecords sharing one export timestamp.
+
+        Args:
+            sessions: The unified sessions to export.
+
+        Yields:
+            An AgentTraceRecord for each session, in input order.
+        """
+        # A batch is one export, so the clock is read once for all of its records
+        timestamp = datetime.now(timezone.utc).isoformat()
+        for session in sessions:
+            yield self.export_session(session, timestamp=timestamp)
+
     def export_to_json(self, session: UnifiedSession, *, indent: int | None = 2) -> str:
         """Export a session to JSON string.
 
@@ -202,8 +248,10 @@ class AgentTraceExporter:
             session: The unified session to export.
             path: Path to write the JSON file.
         """
-        json_content = self.export_to_json(session)
-        path.write_text(json_content, encoding="utf-8")
+        record = self.export_session(session)
+        # Write through a large buffer in one call instead of round-tripping via write_text
+        with path.open("w", encoding="utf-8", buffering=1 << 16) as f:
+            f.write(record.model_dump_json(indent=2))
 
     def _extract_files(self, session: UnifiedSession) -> list[AgentTraceFile]:
         """Extract file attribution data from a session.
@@ -218,10 +266,19 @@ class AgentTraceExporter:
         Returns:
             List of AgentTraceFile objects with conversation attribution.
         """
-        # Map of file path -> set of (model_id, session_url) tuples
-        file_contributions: dict[str, set[tuple[str | None, str]]] = {}
+        # Map of file path -> contributing model IDs. The session URL is the same
+        # for every contribution, so only the model is tracked; a dict keeps the
+        # models unique in first-seen order.
+        file_contributions: dict[str, dict[str | None, None]] = {}
         session_url = f"local://session/{session.source_id}"
 
+        # Local aliases for the names used in the per-part loop
+        file_modification_tools = FILE_MODIFICATION_TOOLS
+        extract_path = self._extract_path_from_tool_call
+        normalize_path = self._normalize_path
+        # The same raw path recurs across edits, so normalize each one only once
+        normalized_paths: dict[str, str] = {}
+
         for turn in session.turns:
             for message in turn.messages:
                 model_id = message.model
@@ -229,36 +286,38 @@ class AgentTraceExporter:
                 for part in message.parts:
                     file_path: str | None = None
 
-                    # Check for FileChangePart
-                    if isinstance(part, FileChangePart):
+                    # Part types are concrete models, so an exact type check
+                    # suffices and skips isinstance's subclass handling
+                    if type(part) is FileChangePart:
                         file_path = part.path
 
                     # Check for tool calls to file modification tools
-                    elif isinstance(part, ToolCallPart):
-                        if part.tool_name in FILE_MODIFICATION_TOOLS:
-                            file_path = self._extract_path_from_tool_call(part)
+                    elif type(part) is ToolCallPart:
+                        if part.tool_name in file_modification_tools:
+                            file_path = extract_path(part)
 
                     if file_path:
                         # Normalize path (remove leading ./)
-                        file_path = self._normalize_path(file_path)
+                        normalized = normalized_paths.get(file_path)
+                        if normalized is None:
+                            normalized = normalized_paths[file_path] = normalize_path(file_path)
+                        file_path = normalized
 
-                        if file_path not in file_contributions:
-                            file_contributions[file_path] = set()
-                        file_contributions[file_path].add((model_id, session_url))
+                        file_contributions.setdefault(file_path, {})[model_id] = None
 
         # Convert to AgentTraceFile objects
         files: list[AgentTraceFile] = []
-        for file_path, contributions in sorted(file_contributions.items()):
+        for file_path, model_ids in sorted(file_contributions.items()):
             conversations: list[AgentTraceConversation] = []
 
-            for model_id, url in contributions:
+            for model_id in model_ids:
                 contributor = AgentTraceContributor(
                     type="ai",
                     model_id=model_id,
                 )
                 # For v1, we skip line-level ranges
                 conversation = AgentTraceConversation(
-                    url=url,
+                    url=session_url,
                     contributor=contributor,
                     ranges=[],  # Empty for file-level attribution
                 )
@@ -283,24 +342,27 @@ class AgentTraceExporter:
 
         # Handle dict input (most common)
         if isinstance(input_data, dict):
-            # Try common parameter names
-            for key in ("filePath", "path", "file_path", "file", "filename"):
-                if key in input_data and isinstance(input_data[key], str):
-                    return input_data[key]
+            path = _path_from_input(input_data)
+            if path is not None:
+                return path
 
         # Handle string input (might be the path directly or JSON)
         if isinstance(input_data, str):
-            # Try to parse as JSON
-            try:
-                parsed = json.loads(input_data)
-                if isinstance(parsed, dict):
-                    for key in ("filePath", "path", "file_path", "file", "filename"):
-                        if key in parsed and isinstance(parsed[key], str):
-                            return parsed[key]
-            except (json.JSONDecodeError, TypeError):
-                # If it looks like a path, use it directly
-                if "/" in input_data or input_data.endswith((".py", ".ts", ".js", ".rs")):
-                    return input_data
+            # Only JSON objects, arrays and strings can carry or look like a path;
+            # anything else goes straight to the path check without a failed parse
+            if input_data.lstrip().startswith(("{", "[", '"')):
+                try:
+                    parsed = json.loads(input_data)
+                except json.JSONDecodeError:
+                    pass
+                else:
+                    if isinstance(parsed, dict):
+                        return _path_from_input(parsed)
+                    return None
+
+            # If it looks like a path, use it directly
+            if "/" in input_data or input_data.endswith(_PATH_SUFFIXES):
+                return input_data
 
         return None
 
@@ -314,20 +376,20 @@ class AgentTraceExporter:
             Normalized path string.
         """
         # Remove leading ./
-        if path.startswith("./"):
-            path = path[2:]
+        path = path.removeprefix("./")
 
         # Remove leading /
         # (We want relative paths for portability)
         if path.startswith("/"):
-            # Try to make it relative by finding common project indicators
-            parts = path.split("/")
-            # Look for common project root indicators
-            for i, part in enumerate(parts):
-                if part in ("src", "lib", "pkg", "app", "tests", "test"):
-                    return "/".join(parts[i:])
+            # Try to make it relative by finding the earliest common project
+            # root indicator; the trailing / lets a final component match too
+            padded = path + "/"
+            hits = [i for marker in _ROOT_MARKERS if (i := padded.find(marker)) != -1]
+            if hits:
+                return padded[min(hits) + 1 : -1]
             # Fallback: just use the last 3 components
-            if len(parts) > 3:
-                return "/".join(parts[-3:])
+            tail = path.rsplit("/", 3)
+            if len(tail) > 3:
+                return "/".join(tail[1:])
 
         return path
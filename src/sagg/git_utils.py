@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import subprocess
+from bisect import bisect_left
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any
 
 
 def is_git_repo(path: Path) -> bool:
@@ -130,35 +132,142 @@ def get_commits_in_range(
         if result.returncode != 0:
             return []
 
-        commits = []
-        for line in result.stdout.strip().split("\n"):
-            if not line:
-                continue
-
-            parts = line.split("|", 3)
-            if len(parts) >= 4:
-                sha, author, timestamp_str, message = parts
-                try:
-                    # Parse ISO timestamp
-                    timestamp = datetime.fromisoformat(timestamp_str)
-                except ValueError:
-                    timestamp = None
-
-                commits.append(
-                    {
-                        "sha": sha,
-                        "author": author,
-                        "timestamp": timestamp,
-                        "message": message,
-                    }
-                )
-
-        return commits
+        return _parse_log_output(result.stdout)
 
     except (subprocess.SubprocessError, OSError):
         return []
 
 
+def _parse_log_output(output: str) -> list[dict[str, Any]]:
+    """Parse `git log --format=%H|%an|%aI|%s` output into commit dictionaries.
+
+    Args:
+        output: Raw stdout from git log.
+
+    Returns:
+        List of commit dictionaries with sha, message, timestamp, and author.
+    """
+    commits = []
+    for line in output.strip().split("\n"):
+        if not line:
+            continue
+
+        parts = line.split("|", 3)
+        if len(parts) >= 4:
+            sha, author, timestamp_str, message = parts
+            try:
+                # Parse ISO timestamp
+                timestamp = datetime.fromisoformat(timestamp_str)
+            except ValueError:
+                timestamp = None
+
+            commits.append(
+                {
+                    "sha": sha,
+                    "author": author,
+                    "timestamp": timestamp,
+                    "message": message,
+                }
+            )
+
+    return commits
+
+
+def load_commit_timeline(
+    repo_path: Path,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    verified: bool = False,
+) -> list[dict[str, Any]]:
+    """Load the commits reachable from HEAD, sorted by timestamp.
+
+    Reads the history with a single git invocation so that many lookups
+    against the same repository can be answered with closest_commit_in().
+
+    Args:
+        repo_path: Path to the git repository.
+        start: Only load commits made at or after this time.
+        end: Only load commits made at or before this time.
+        verified: Skip the repository check when the caller has already
+            confirmed the path is a git repo.
+
+    Returns:
+        Commit dictionaries sorted by ascending timestamp. Commits with an
+        unparseable timestamp are dropped.
+    """
+    if not verified and (not repo_path.exists() or not is_git_repo(repo_path)):
+        return []
+
+    # Bound the walk so large histories don't hit the timeout
+    cmd = ["git", "log", "--format=%H|%an|%aI|%s"]
+    for option, bound in (("--since", start), ("--until", end)):
+        if bound is not None:
+            if bound.tzinfo is None:
+                bound = bound.replace(tzinfo=timezone.utc)
+            cmd.append(f"{option}={bound.isoformat()}")
+
+    try:
+        result = subprocess.run(
+            cmd,
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            errors="replace",
+            timeout=30,
+        )
+    except (subprocess.SubprocessError, OSError):
+        return []
+
+    if result.returncode != 0:
+        return []
+
+    commits = [c for c in _parse_log_output(result.stdout) if c["timestamp"] is not None]
+    for commit in commits:
+        if commit["timestamp"].tzinfo is None:
+            commit["timestamp"] = commit["timestamp"].replace(tzinfo=timezone.utc)
+
+    commits.sort(key=lambda c: c["timestamp"])
+    return commits
+
+
+def closest_commit_in(
+    timeline: list[dict[str, Any]],
+    timestamp: datetime,
+    window_hours: int = 2,
+) -> dict[str, Any] | None:
+    """Find the commit closest to a timestamp in a sorted commit timeline.
+
+    Args:
+        timeline: Commits sorted by timestamp, as returned by load_commit_timeline().
+        timestamp: Target timestamp to find commits near.
+        window_hours: Hours before and after to search (default: 2).
+
+    Returns:
+        The nearest commit within the window, or None if there is none.
+    """
+    if not timeline:
+        return None
+
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+
+    # Only the neighbours around the insertion point can be closest
+    index = bisect_left(timeline, timestamp, key=lambda c: c["timestamp"])
+    candidates = timeline[max(index - 1, 0) : index + 1]
+
+    window = timedelta(hours=window_hours).total_seconds()
+    closest_commit = None
+    smallest_diff = None
+
+    for commit in candidates:
+        diff = abs((commit["timestamp"] - timestamp).total_seconds())
+        if diff <= window and (smallest_diff is None or diff < smallest_diff):
+            smallest_diff = diff
+            closest_commit = commit
+
+    return closest_commit
+
+
 def find_closest_commit(
     repo_path: Path,
     timestamp: datetime,
@@ -144,8 +144,11 @@ class Database:
             )
             # Enable foreign keys
             self._connection.execute("PRAGMA foreign_keys = ON")
-            # Use WAL mode for better concurrent access
-            self._connection.execute("PRAGMA journal_mode = WAL")
+            # Use WAL mode for better concurrent access. The mode is stored in
+            # the database file, so only switch when it isn't set yet.
+            mode = self._connection.execute("PRAGMA journal_mode").fetchone()[0]
+            if mode.lower() != "wal":
+                self._connection.execute("PRAGMA journal_mode = WAL")
             # Return rows as Row objects for dict-like access
             self._connection.row_factory = sqlite3.Row
 
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import json
 import time
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Literal
 
 from sagg.models import (
     GitContext,
@@ -163,6 +164,28 @@ class SessionStore:
         content = session.extract_text_content()
         self._db.update_fts_content(session.id, content)
 
+    def update_git_contexts(self, updates: list[tuple[str, GitContext]]) -> int:
+        """Update the git context of several sessions in one transaction.
+
+        Only the git columns are written, so sessions don't need to be loaded
+        and re-saved with their content.
+
+        Args:
+            updates: (session_id, git) pairs to apply.
+
+        Returns:
+            Number of sessions updated.
+        """
+        if not updates:
+            return 0
+
+        with self._db.transaction() as cursor:
+            cursor.executemany(
+                "UPDATE sessions SET git_branch = ?, git_commit = ? WHERE id = ?",
+                [(git.branch, git.commit, session_id) for session_id, git in updates],
+            )
+            return cursor.rowcount
+
     def _save_content(self, session: UnifiedSession) -> None:
         """Save session content to JSONL file.
 
@@ -212,6 +235,87 @@ class SessionStore:
 
         return self._row_to_session(row, include_content=True)
 
+    def find_by_id_prefix(self, prefix: str, limit: int = 5) -> list[str]:
+        """Find session IDs starting with a prefix.
+
+        Uses a range scan on the primary key (case-sensitive, unlike LIKE),
+        so only matching IDs are read.
+
+        Args:
+            prefix: Partial session ID.
+            limit: Maximum number of IDs to return.
+
+        Returns:
+            Matching session IDs in sorted order.
+        """
+        if not prefix:
+            return []
+        cursor = self._db.execute(
+            "SELECT id FROM sessions WHERE id >= ? AND id < ? ORDER BY id LIMIT ?",
+            (prefix, prefix + "\U0010ffff", limit),
+        )
+        return [row["id"] for row in cursor]
+
+    def get_sessions_by_ids(
+        self, session_ids: list[str], chunk_size: int = 500
+    ) -> dict[str, UnifiedSession]:
+        """Get several sessions, with content, using batched IN queries.
+
+        Args:
+            session_ids: Session IDs to retrieve.
+            chunk_size: Maximum IDs per query, kept below SQLite's bound
+                parameter limit.
+
+        Returns:
+            Mapping of session ID to session for the IDs that exist.
+        """
+        sessions: dict[str, UnifiedSession] = {}
+        for start in range(0, len(session_ids), chunk_size):
+            chunk = session_ids[start : start + chunk_size]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor = self._db.execute(
+                f"SELECT * FROM sessions WHERE id IN ({placeholders})", tuple(chunk)
+            )
+            for row in cursor.fetchall():
+                sessions[row["id"]] = self._row_to_session(row, include_content=True)
+        return sessions
+
+    @staticmethod
+    def _session_filter(
+        source: str | None,
+        project: str | None,
+        since: datetime | None,
+        time_column: Literal["created_at", "updated_at"] = "created_at",
+    ) -> tuple[str, list[str | int]]:
+        """Build the WHERE clause shared by the session listing queries.
+
+        Args:
+            source: Filter by source tool.
+            project: Filter by project path or name (partial match).
+            since: Only include sessions whose time_column is at or after this.
+            time_column: Timestamp column that since applies to.
+
+        Returns:
+            Tuple of (WHERE clause, bound parameters).
+        """
+        conditions = []
+        params: list[str | int] = []
+
+        if source is not None:
+            conditions.append("source = ?")
+            params.append(source)
+
+        if project is not None:
+            conditions.append("(project_path LIKE ? OR project_name LIKE ?)")
+            params.append(f"%{project}%")
+            params.append(f"%{project}%")
+
+        if since is not None:
+            conditions.append(f"{time_column} >= ?")
+            params.append(int(since.timestamp()))
+
+        return " AND ".join(conditions) if conditions else "1=1", params
+
     def list_sessions(
         self,
         source: str | None = None,
@@ -232,26 +336,48 @@ class SessionStore:
         Returns:
             List of sessions matching the filters.
         """
-        conditions = []
-        params: list[str | int] = []
+        where_clause, params = self._session_filter(source, project, since)
 
-        if source is not None:
-            conditions.append("source = ?")
-            params.append(source)
+        query = f"""
+            SELECT * FROM sessions
+            WHERE {where_clause}
+            ORDER BY created_at DESC
+            LIMIT ? OFFSET ?
+        """
+        params.append(limit)
+        params.append(offset)
 
-        if project is not None:
-            conditions.append("(project_path LIKE ? OR project_name LIKE ?)")
-            params.append(f"%{project}%")
-            params.append(f"%{project}%")
+        cursor = self._db.execute(query, tuple(params))
+        return [self._row_to_session(row, include_content=False) for row in cursor]
 
-        if since is not None:
-            conditions.append("created_at >= ?")
-            params.append(int(since.timestamp()))
+    def list_session_summaries(
+        self,
+        source: str | None = None,
+        project: str | None = None,
+        since: datetime | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[tuple[str, str, str | None, str | None, datetime]]:
+        """List the columns needed for a session table, without hydrating models.
 
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        Takes the same filters and ordering as list_sessions.
+
+        Args:
+            source: Filter by source tool (opencode, claude, etc.).
+            project: Filter by project path (partial match).
+            since: Only include sessions created after this datetime.
+            limit: Maximum number of sessions to return.
+            offset: Number of sessions to skip.
+
+        Returns:
+            List of (id, source, title, project_name, created_at) tuples.
+        """
+        from datetime import timezone
+
+        where_clause, params = self._session_filter(source, project, since)
 
         query = f"""
-            SELECT * FROM sessions
+            SELECT id, source, title, project_name, created_at FROM sessions
             WHERE {where_clause}
             ORDER BY created_at DESC
             LIMIT ? OFFSET ?
@@ -260,7 +386,201 @@ class SessionStore:
         params.append(offset)
 
         cursor = self._db.execute(query, tuple(params))
-        return [self._row_to_session(row, include_content=False) for row in cursor]
+        return [
+            (
+                row["id"],
+                row["source"],
+                row["title"],
+                row["project_name"],
+                datetime.fromtimestamp(row["created_at"], tz=timezone.utc),
+            )
+            for row in cursor
+        ]
+
+    def count_sessions(
+        self,
+        source: str | None = None,
+        project: str | None = None,
+        since: datetime | None = None,
+    ) -> int:
+        """Count sessions matching the same filters as list_sessions.
+
+        Args:
+            source: Filter by source tool (opencode, claude, etc.).
+            project: Filter by project path (partial match).
+            since: Only include sessions created after this datetime.
+
+        Returns:
+            Number of matching sessions.
+        """
+        where_clause, params = self._session_filter(source, project, since)
+
+        cursor = self._db.execute(
+            f"SELECT COUNT(*) as count FROM sessions WHERE {where_clause}", tuple(params)
+        )
+        return int(cursor.fetchone()["count"])
+
+    def iter_sessions(
+        self,
+        source: str | None = None,
+        project: str | None = None,
+        since: datetime | None = None,
+        page_size: int = 100,
+    ) -> Iterator[UnifiedSession]:
+        """Iterate sessions by most recent activity, one page at a time.
+
+        Uses keyset pagination on (updated_at, id), so each page is an indexed
+        range scan and only one page of rows is materialized at a time.
+        Callers can stop iterating as soon as they have what they need.
+
+        Args:
+            source: Filter by source tool (opencode, claude, etc.).
+            project: Filter by project path (partial match).
+            since: Only include sessions updated at or after this datetime.
+            page_size: Number of rows fetched per query.
+
+        Yields:
+            Sessions ordered by updated_at descending (without content).
+        """
+        filter_clause, params = self._session_filter(source, project, since, "updated_at")
+
+        last_key: tuple[int, str] | None = None
+        while True:
+            where_clause = filter_clause
+            page_params = list(params)
+            if last_key is not None:
+                where_clause += " AND (updated_at < ? OR (updated_at = ? AND id < ?))"
+                page_params.extend([last_key[0], last_key[0], last_key[1]])
+
+            query = f"""
+                SELECT * FROM sessions
+                WHERE {where_clause}
+                ORDER BY updated_at DESC, id DESC
+                LIMIT ?
+            """
+            page_params.append(page_size)
+
+            rows = self._db.execute(query, tuple(page_params)).fetchall()
+            for row in rows:
+                yield self._row_to_session(row, include_content=False)
+
+            if len(rows) < page_size:
+                return
+            last_key = (rows[-1]["updated_at"], rows[-1]["id"])
+
+    def iter_sessions_for_summary(
+        self,
+        project: str | None = None,
+        since: datetime | None = None,
+        files_limit: int = 0,
+    ) -> Iterator[tuple[str, str, str | None, int | None, list[str], int]]:
+        """Iterate the columns of a work summary, grouped by project and day.
+
+        Rows come back ordered by project name, then by most recent activity,
+        so consecutive rows can be grouped with itertools.groupby without any
+        sorting on the Python side.
+
+        Args:
+            project: Filter by project path (partial match).
+            since: Only include sessions updated at or after this datetime.
+            files_limit: Return up to this many modified files per session. The
+                list is sliced and counted inside SQLite, so only these entries
+                are decoded in Python. 0 skips the files entirely.
+
+        Yields:
+            (project_name, day, title, duration_ms, files, files_count) tuples,
+            where day is the UTC date of updated_at as YYYY-MM-DD, files holds the
+            first files_limit modified files out of files_count in total, and
+            sessions without a project are reported under "Unknown Project".
+        """
+        where_clause, params = self._session_filter(None, project, since, "updated_at")
+        if files_limit > 0:
+            files_columns = """
+                   (SELECT json_group_array(value) FROM (
+                       SELECT value FROM json_each(files_modified_json) LIMIT ?
+                   )) AS files_json,
+                   COALESCE(json_array_length(files_modified_json), 0) AS files_count"""
+            params.insert(0, files_limit)
+        else:
+            files_columns = "NULL AS files_json, 0 AS files_count"
+
+        cursor = self._db.execute(
+            f"""
+            SELECT COALESCE(NULLIF(project_name, ''), 'Unknown Project') AS project,
+                   date(updated_at, 'unixepoch') AS day,
+                   title, duration_ms, {files_columns}
+            FROM sessions
+            WHERE {where_clause}
+            ORDER BY project, updated_at DESC, id DESC
+            """,
+            tuple(params),
+        )
+        for row in cursor:
+            files_json = row["files_json"]
+            yield (
+                row["project"],
+                row["day"],
+                row["title"],
+                row["duration_ms"],
+                json.loads(files_json) if files_json else [],
+                row["files_count"],
+            )
+
+    def iter_sessions_full(
+        self,
+        limit: int | None = None,
+        page_size: int = 100,
+        source: str | None = None,
+        project: str | None = None,
+        since: datetime | None = None,
+    ) -> Iterator[UnifiedSession]:
+        """Iterate sessions with their content, newest first, one page at a time.
+
+        Rows are read with keyset pagination on (created_at, id), and each
+        session's content is loaded as it is yielded, so only one page of
+        rows and one hydrated session need to be held at once.
+
+        Args:
+            limit: Maximum number of sessions to yield (None for all).
+            page_size: Number of rows fetched per query.
+            source: Filter by source tool (opencode, claude, etc.).
+            project: Filter by project path (partial match).
+            since: Only include sessions created after this datetime.
+
+        Yields:
+            Sessions ordered by created_at descending, with content.
+        """
+        where_clause, params = self._session_filter(source, project, since)
+
+        remaining = limit
+        last_key: tuple[int, str] | None = None
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            page_where = where_clause
+            page_params = list(params)
+            if last_key is not None:
+                page_where += " AND (created_at < ? OR (created_at = ? AND id < ?))"
+                page_params.extend([last_key[0], last_key[0], last_key[1]])
+            page_params.append(size)
+
+            rows = self._db.execute(
+                f"""
+                SELECT * FROM sessions
+                WHERE {page_where}
+                ORDER BY created_at DESC, id DESC
+                LIMIT ?
+                """,
+                tuple(page_params),
+            ).fetchall()
+
+            for row in rows:
+                yield self._row_to_session(row, include_content=True)
+
+            if remaining is not None:
+                remaining -= len(rows)
+            if len(rows) < size:
+                return
+            last_key = (rows[-1]["created_at"], rows[-1]["id"])
 
     def search_sessions(self, query: str, limit: int = 50) -> list[UnifiedSession]:
         """Search sessions using full-text search.
@@ -334,6 +654,18 @@ class SessionStore:
         )
         return cursor.fetchone() is not None
 
+    def get_source_ids(self, source: str) -> set[str]:
+        """Get the source IDs of every stored session for a source.
+
+        Args:
+            source: Source tool name.
+
+        Returns:
+            Set of original session IDs already imported from the source.
+        """
+        cursor = self._db.execute("SELECT source_id FROM sessions WHERE source = ?", (source,))
+        return {row[0] for row in cursor}
+
     def get_session_by_source(self, source: str, source_id: str) -> UnifiedSession | None:
         """Get a session by source and source_id.
 
@@ -652,54 +984,78 @@ class SessionStore:
 
     # Facet management methods
 
+    _UPSERT_FACET_SQL = """
+        INSERT OR REPLACE INTO session_facets (
+            session_id, source, analyzed_at, analyzer_version, analyzer_model,
+            underlying_goal, goal_categories_json, task_type,
+            outcome, completion_confidence,
+            session_type, complexity_score,
+            friction_counts_json, friction_detail, friction_score,
+            tools_helped_json, tools_didnt_json, tool_helpfulness,
+            primary_language, files_pattern,
+            brief_summary, key_decisions_json
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _facet_params(facet_data: dict[str, Any]) -> tuple[Any, ...]:
+        """Convert a facet dict into parameters for _UPSERT_FACET_SQL.
+
+        Args:
+            facet_data: Dictionary with facet fields matching session_facets schema.
+
+        Returns:
+            Parameter tuple in column order.
+        """
+        return (
+            facet_data["session_id"],
+            facet_data["source"],
+            facet_data["analyzed_at"],
+            facet_data["analyzer_version"],
+            facet_data.get("analyzer_model"),
+            facet_data["underlying_goal"],
+            json.dumps(facet_data.get("goal_categories", {})),
+            facet_data["task_type"],
+            facet_data["outcome"],
+            facet_data.get("completion_confidence", 0.5),
+            facet_data["session_type"],
+            facet_data.get("complexity_score", 3),
+            json.dumps(facet_data.get("friction_counts", {})),
+            facet_data.get("friction_detail"),
+            facet_data.get("friction_score", 0.0),
+            json.dumps(facet_data.get("tools_that_helped", [])),
+            json.dumps(facet_data.get("tools_that_didnt", [])),
+            facet_data.get("tool_helpfulness", "moderately"),
+            facet_data.get("primary_language"),
+            facet_data.get("files_pattern"),
+            facet_data.get("brief_summary", ""),
+            json.dumps(facet_data.get("key_decisions", [])),
+        )
+
     def upsert_facet(self, facet_data: dict) -> None:
         """Save or update a session facet.
 
         Args:
             facet_data: Dictionary with facet fields matching session_facets schema.
         """
-        import json as _json
-
-        self._db.execute(
-            """
-            INSERT OR REPLACE INTO session_facets (
-                session_id, source, analyzed_at, analyzer_version, analyzer_model,
-                underlying_goal, goal_categories_json, task_type,
-                outcome, completion_confidence,
-                session_type, complexity_score,
-                friction_counts_json, friction_detail, friction_score,
-                tools_helped_json, tools_didnt_json, tool_helpfulness,
-                primary_language, files_pattern,
-                brief_summary, key_decisions_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                facet_data["session_id"],
-                facet_data["source"],
-                facet_data["analyzed_at"],
-                facet_data["analyzer_version"],
-                facet_data.get("analyzer_model"),
-                facet_data["underlying_goal"],
-                _json.dumps(facet_data.get("goal_categories", {})),
-                facet_data["task_type"],
-                facet_data["outcome"],
-                facet_data.get("completion_confidence", 0.5),
-                facet_data["session_type"],
-                facet_data.get("complexity_score", 3),
-                _json.dumps(facet_data.get("friction_counts", {})),
-                facet_data.get("friction_detail"),
-                facet_data.get("friction_score", 0.0),
-                _json.dumps(facet_data.get("tools_that_helped", [])),
-                _json.dumps(facet_data.get("tools_that_didnt", [])),
-                facet_data.get("tool_helpfulness", "moderately"),
-                facet_data.get("primary_language"),
-                facet_data.get("files_pattern"),
-                facet_data.get("brief_summary", ""),
-                _json.dumps(facet_data.get("key_decisions", [])),
-            ),
-        )
+        self._db.execute(self._UPSERT_FACET_SQL, self._facet_params(facet_data))
         self._db.commit()
 
+    def upsert_facets_bulk(self, facets: list[dict[str, Any]]) -> None:
+        """Save or update several session facets in one transaction.
+
+        Either all facets are written or, if any row fails, none are.
+
+        Args:
+            facets: Facet dictionaries matching session_facets schema.
+        """
+        if not facets:
+            return
+
+        rows = [self._facet_params(facet_data) for facet_data in facets]
+        with self._db.transaction() as cursor:
+            cursor.executemany(self._UPSERT_FACET_SQL, rows)
+
     def get_facet(self, session_id: str) -> dict | None:
         """Get a facet by session ID.
 
@@ -766,24 +1122,60 @@ class SessionStore:
         cursor = self._db.execute(query, tuple(params))
         return [self._row_to_facet(row) for row in cursor]
 
-    def get_unfaceted_sessions(
+    def get_completed_facet_ids(
         self,
-        since: datetime | None = None,
+        analyzer_version: str,
         source: str | None = None,
+        since: datetime | None = None,
         project: str | None = None,
-        limit: int = 500,
-    ) -> list[UnifiedSession]:
-        """Get sessions that don't have facets yet.
+    ) -> set[str]:
+        """Get IDs of sessions already analyzed by a given analyzer version.
+
+        Only the session_id column is read, so no facet JSON is decoded.
 
         Args:
-            since: Only sessions created after this datetime.
+            analyzer_version: Analyzer version to match (e.g. "llm_v1").
             source: Filter by source tool.
-            project: Filter by project path/name (partial match).
-            limit: Maximum results.
+            since: Only facets for sessions created after this datetime.
+            project: Filter by project (partial match via sessions table).
 
         Returns:
-            List of sessions without facets.
+            Set of session IDs.
         """
+        conditions = ["f.analyzer_version = ?"]
+        params: list[str | int] = [analyzer_version]
+
+        if source is not None:
+            conditions.append("f.source = ?")
+            params.append(source)
+
+        if since is not None:
+            conditions.append("s.created_at >= ?")
+            params.append(int(since.timestamp()))
+
+        if project is not None:
+            conditions.append("(s.project_path LIKE ? OR s.project_name LIKE ?)")
+            params.append(f"%{project}%")
+            params.append(f"%{project}%")
+
+        where_clause = " AND ".join(conditions)
+
+        query = f"""
+            SELECT f.session_id FROM session_facets f
+            JOIN sessions s ON f.session_id = s.id
+            WHERE {where_clause}
+        """
+
+        cursor = self._db.execute(query, tuple(params))
+        return {row["session_id"] for row in cursor}
+
+    @staticmethod
+    def _unfaceted_filter(
+        since: datetime | None,
+        source: str | None,
+        project: str | None,
+    ) -> tuple[str, list[str | int]]:
+        """Build the WHERE clause shared by the unfaceted-session queries."""
         conditions = ["f.session_id IS NULL"]
         params: list[str | int] = []
 
@@ -800,7 +1192,27 @@ class SessionStore:
             params.append(f"%{project}%")
             params.append(f"%{project}%")
 
-        where_clause = " AND ".join(conditions)
+        return " AND ".join(conditions), params
+
+    def get_unfaceted_sessions(
+        self,
+        since: datetime | None = None,
+        source: str | None = None,
+        project: str | None = None,
+        limit: int = 500,
+    ) -> list[UnifiedSession]:
+        """Get sessions that don't have facets yet.
+
+        Args:
+            since: Only sessions created after this datetime.
+            source: Filter by source tool.
+            project: Filter by project path/name (partial match).
+            limit: Maximum results.
+
+        Returns:
+            List of sessions without facets.
+        """
+        where_clause, params = self._unfaceted_filter(since, source, project)
 
         query = f"""
             SELECT s.* FROM sessions s
@@ -814,6 +1226,33 @@ class SessionStore:
         cursor = self._db.execute(query, tuple(params))
         return [self._row_to_session(row, include_content=False) for row in cursor]
 
+    def count_unfaceted_sessions(
+        self,
+        since: datetime | None = None,
+        source: str | None = None,
+        project: str | None = None,
+    ) -> int:
+        """Count sessions that don't have facets yet.
+
+        Args:
+            since: Only sessions created after this datetime.
+            source: Filter by source tool.
+            project: Filter by project path/name (partial match).
+
+        Returns:
+            Number of sessions without facets.
+        """
+        where_clause, params = self._unfaceted_filter(since, source, project)
+
+        query = f"""
+            SELECT COUNT(*) as count FROM sessions s
+            LEFT JOIN session_facets f ON s.id = f.session_id
+            WHERE {where_clause}
+        """
+
+        cursor = self._db.execute(query, tuple(params))
+        return int(cursor.fetchone()["count"])
+
     def get_facet_stats(self) -> dict:
         """Get aggregated facet statistics.
 
@@ -932,30 +1371,47 @@ class SessionStore:
         Returns:
             Total tokens (input + output) used in the period.
         """
-        from datetime import timezone
+        return self.get_usage_multi([period]).get(period, 0)
 
-        now = datetime.now(timezone.utc)
+    def get_usage_multi(self, periods: list[str]) -> dict[str, int]:
+        """Get total token usage for several periods with a single query.
 
-        if period == "daily":
-            # Start of today (midnight UTC)
-            start_of_period = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        elif period == "weekly":
-            # Start of week (Monday midnight UTC)
-            days_since_monday = now.weekday()
-            start_of_period = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            start_of_period = start_of_period - timedelta(days=days_since_monday)
-        else:
-            return 0
+        Args:
+            periods: Budget periods ('daily' and/or 'weekly').
 
-        start_timestamp = int(start_of_period.timestamp())
+        Returns:
+            Mapping of period to total tokens (input + output) used in it.
+            Unknown periods map to 0.
+        """
+        from datetime import timezone
 
+        now = datetime.now(timezone.utc)
+        start_of_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        starts: dict[str, int] = {}
+        for period in periods:
+            if period == "daily":
+                # Start of today (midnight UTC)
+                starts[period] = int(start_of_today.timestamp())
+            elif period == "weekly":
+                # Start of week (Monday midnight UTC)
+                start_of_week = start_of_today - timedelta(days=now.weekday())
+                starts[period] = int(start_of_week.timestamp())
+
+        usage = dict.fromkeys(periods, 0)
+        if not starts:
+            return usage
+
+        # One scan over the earliest window, summing each period conditionally
+        sums = ", ".join(
+            "COALESCE(SUM(CASE WHEN created_at >= ? THEN input_tokens + output_tokens END), 0)"
+            for _ in starts
+        )
         cursor = self._db.execute(
-            """
-            SELECT COALESCE(SUM(input_tokens + output_tokens), 0) as total
-            FROM sessions
-            WHERE created_at >= ?
-            """,
-            (start_timestamp,),
+            f"SELECT {sums} FROM sessions WHERE created_at >= ?",
+            (*starts.values(), min(starts.values())),
         )
         row = cursor.fetchone()
-        return row["total"] if row else 0
+        if row is not None:
+            usage.update(zip(starts, row, strict=True))
+        return usage
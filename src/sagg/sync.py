@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -169,6 +170,26 @@ class SessionSyncer:
         Yields:
             SyncEvent objects on each sync.
         """
+        for batch in self.watch_batches(source=source, debounce_ms=debounce_ms):
+            yield from batch
+
+    def watch_batches(
+        self,
+        source: str | None = None,
+        debounce_ms: int = 2000,
+    ) -> Iterator[list[SyncEvent]]:
+        """Watch for changes and sync continuously, grouped per change batch.
+
+        Like watch(), but yields all SyncEvents produced by one debounced
+        batch of filesystem changes together, so callers can render them at once.
+
+        Args:
+            source: Optional source filter.
+            debounce_ms: Debounce interval in milliseconds.
+
+        Yields:
+            Lists of SyncEvent objects, one list per batch of changes.
+        """
         try:
             from watchfiles import watch as watch_files
         except ImportError as e:
@@ -197,18 +218,24 @@ class SessionSyncer:
             # Determine which sources had changes
             changed_sources = self._identify_changed_sources(changes, paths)
 
+            batch: list[SyncEvent] = []
             for src in changed_sources:
                 adapter = self._adapters_by_name.get(src)
                 if adapter is None:
                     continue
 
                 result = self._sync_adapter(adapter, dry_run=False)
-                yield SyncEvent(
-                    source=src,
-                    new_count=result["new"],
-                    skipped_count=result["skipped"],
+                batch.append(
+                    SyncEvent(
+                        source=src,
+                        new_count=result["new"],
+                        skipped_count=result["skipped"],
+                    )
                 )
 
+            if batch:
+                yield batch
+
     def _get_adapters(self, source: str | None = None) -> list[SessionAdapter]:
         """Get adapters, optionally filtered by source name.
 
@@ -241,20 +268,24 @@ class SessionSyncer:
         Returns:
             List of source names that had changes.
         """
+        # Resolve each adapter's root once per batch rather than once per
+        # changed path, and match on string prefixes instead of Path objects
+        roots = [
+            (str(adapter.get_default_path()).rstrip(os.sep) + os.sep, adapter.name)
+            for adapter in self.adapters
+        ]
         changed_sources: set[str] = set()
 
         for _change_type, changed_path in changes:
-            changed_path = Path(changed_path)
-
-            for adapter in self.adapters:
-                adapter_path = adapter.get_default_path()
-                try:
-                    # Check if the changed path is under this adapter's path
-                    changed_path.relative_to(adapter_path)
-                    changed_sources.add(adapter.name)
+            changed_path = str(changed_path) + os.sep
+
+            for root, name in roots:
+                # Check if the changed path is (under) this adapter's path
+                if changed_path.startswith(root):
+                    changed_sources.add(name)
                     break
-                except ValueError:
-                    # Not under this path
-                    continue
+
+            if len(changed_sources) == len(roots):
+                break
 
         return list(changed_sources)
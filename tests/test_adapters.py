@@ -78,3 +78,106 @@ class TestSessionAdapter:
         assert adapter.has_changed(ref, base_time) is False
         # Modified before
         assert adapter.has_changed(ref, base_time + timedelta(minutes=1)) is False
+
+
+class BatchAdapter(ConcreteAdapter):
+    """Adapter yielding many sessions, one of which fails to parse."""
+
+    def list_sessions(self, since: datetime | None = None) -> list[SessionRef]:
+        now = datetime.now(UTC)
+        return [
+            SessionRef(id=f"batch-{i}", path=Path("/tmp"), created_at=now, updated_at=now)
+            for i in range(50)
+        ]
+
+    def parse_session(self, ref: SessionRef):
+        if ref.id == "batch-7":
+            raise ValueError("corrupt")
+        from sagg.models import SessionStats, SourceTool, UnifiedSession, generate_session_id
+
+        return UnifiedSession(
+            id=generate_session_id(),
+            source=SourceTool.OPENCODE,
+            source_id=ref.id,
+            source_path=str(ref.path),
+            title=ref.id,
+            created_at=ref.created_at,
+            updated_at=ref.updated_at,
+            stats=SessionStats(),
+            turns=[],
+        )
+
+
+def test_collect_saves_sessions_as_they_arrive(session_store, monkeypatch):
+    """Test collect saves more sessions than fit in the handoff queue."""
+    from click.testing import CliRunner
+
+    from sagg.adapters import registry
+    from sagg.cli import cli
+
+    monkeypatch.setattr("sagg.cli.SessionStore", lambda: session_store)
+    monkeypatch.setattr(registry, "get_available_adapters", lambda: [BatchAdapter()])
+    saved = []
+    monkeypatch.setattr(session_store, "save_session", saved.append)
+
+    result = CliRunner().invoke(cli, ["collect"])
+
+    assert result.exit_code == 0, result.output
+    assert len(saved) == 49
+    assert "Failed to parse session batch-7" in result.output
+    assert "Collected 49 new session(s) from Test Adapter" in result.output
+
+
+def test_collect_warns_and_continues_when_save_fails(session_store, monkeypatch):
+    """Test a failed save is reported without stopping the collection."""
+    from click.testing import CliRunner
+
+    from sagg.adapters import registry
+    from sagg.cli import cli
+
+    monkeypatch.setattr("sagg.cli.SessionStore", lambda: session_store)
+    monkeypatch.setattr(registry, "get_available_adapters", lambda: [BatchAdapter()])
+    saved = []
+
+    def save_session(session):
+        if session.source_id == "batch-3":
+            raise OSError("disk full")
+        saved.append(session)
+
+    monkeypatch.setattr(session_store, "save_session", save_session)
+
+    result = CliRunner().invoke(cli, ["collect"])
+
+    assert result.exit_code == 0, result.output
+    assert len(saved) == 48
+    assert "Failed to parse session batch-3: disk full" in result.output
+    assert "Collected 48 new session(s) from Test Adapter" in result.output
+
+
+def test_collect_store_error_does_not_strand_workers(session_store, monkeypatch):
+    """Test a store error while preparing workers ends collect instead of hanging."""
+    from click.testing import CliRunner
+
+    from sagg.adapters import registry
+    from sagg.cli import cli
+
+    class OtherAdapter(BatchAdapter):
+        @property
+        def name(self) -> str:
+            return "other"
+
+    def get_source_ids(source):
+        if source == "other":
+            raise RuntimeError("database is locked")
+        return set()
+
+    monkeypatch.setattr("sagg.cli.SessionStore", lambda: session_store)
+    monkeypatch.setattr(
+        registry, "get_available_adapters", lambda: [BatchAdapter(), OtherAdapter()]
+    )
+    monkeypatch.setattr(session_store, "get_source_ids", get_source_ids)
+
+    result = CliRunner().invoke(cli, ["collect"])
+
+    assert result.exit_code != 0
+    assert isinstance(result.exception, RuntimeError)
@@ -4,7 +4,7 @@ import pytest
 from datetime import datetime, timezone, timedelta
 from click.testing import CliRunner
 
-from sagg.cli import cli, parse_token_amount
+from sagg.cli import cli, parse_duration, parse_token_amount
 from sagg.storage import SessionStore
 from sagg.models import (
     UnifiedSession,
@@ -54,6 +54,25 @@ class TestParseTokenAmount:
             parse_token_amount("")
         with pytest.raises(ValueError):
             parse_token_amount("100x")
+        for bad in ("k", ".5k", "1.k", "1.2.3M", "-1k", "1e3k"):
+            with pytest.raises(ValueError):
+                parse_token_amount(bad)
+
+
+class TestParseDuration:
+    """Tests for parsing duration strings."""
+
+    def test_parse_units(self):
+        """Test hour, day and week units, case-insensitively."""
+        assert parse_duration("24h") == timedelta(hours=24)
+        assert parse_duration("7d") == timedelta(days=7)
+        assert parse_duration("2W") == timedelta(weeks=2)
+
+    def test_invalid_format_raises_error(self):
+        """Test that invalid formats raise ValueError."""
+        for bad in ("", "d", "7", "7x", "1.5d", "-1d", " 7d"):
+            with pytest.raises(ValueError):
+                parse_duration(bad)
 
 
 class TestBudgetStorage:
@@ -161,6 +180,26 @@ class TestBudgetStorage:
         assert daily_usage >= 0
         assert daily_usage <= 1500
 
+    def test_get_usage_multi_matches_single_period(self, session_store):
+        """get_usage_multi returns the same totals as per-period queries."""
+        now = datetime.now(timezone.utc)
+        session_store.save_session(
+            _create_session_with_tokens(input_tokens=1000, output_tokens=500, created_at=now)
+        )
+        session_store.save_session(
+            _create_session_with_tokens(
+                input_tokens=10000, output_tokens=5000, created_at=now - timedelta(days=14)
+            )
+        )
+
+        usage = session_store.get_usage_multi(["daily", "weekly"])
+        assert usage == {
+            "daily": session_store.get_usage_for_period("daily"),
+            "weekly": session_store.get_usage_for_period("weekly"),
+        }
+        assert session_store.get_usage_multi([]) == {}
+        assert session_store.get_usage_multi(["monthly"]) == {"monthly": 0}
+
 
 class TestBudgetCLI:
     """Tests for budget CLI commands."""
@@ -228,6 +267,42 @@ class TestBudgetCLI:
         assert "Daily Budget" in result.output or "daily" in result.output.lower()
         assert "Weekly Budget" in result.output or "weekly" in result.output.lower()
 
+    def test_budget_show_alerts_when_over_budget(self, session_store, monkeypatch):
+        """Test show renders a full bar and an alert once usage passes 95%."""
+        session_store.set_budget("daily", 1000)
+        session_store.save_session(
+            _create_session_with_tokens(
+                input_tokens=900,
+                output_tokens=200,
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+
+        monkeypatch.setattr("sagg.cli.SessionStore", lambda: session_store)
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["budget", "show"])
+
+        assert result.exit_code == 0
+        assert "[" + "=" * 40 + "]" in result.output
+        assert "Daily budget nearly exhausted" in result.output
+        assert "Weekly Budget" not in result.output
+
+    def test_budget_show_store_init_failure(self, monkeypatch):
+        """Test show exits cleanly when the store cannot be opened."""
+
+        def broken_store():
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr("sagg.cli.SessionStore", broken_store)
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["budget", "show"])
+
+        assert result.exit_code == 1
+        assert "Error initializing store" in result.output
+        assert "disk full" in result.output
+
     def test_budget_show_no_budgets(self, session_store, monkeypatch):
         """Test show when no budgets are set."""
         monkeypatch.setattr("sagg.cli.SessionStore", lambda: session_store)
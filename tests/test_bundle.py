@@ -403,6 +403,31 @@ class TestBundleIntegrity:
 
         assert verify_bundle(bundle_path) is False
 
+    def test_verify_detects_tampered_session_line(
+        self, temp_store, sample_sessions, temp_bundle_dir
+    ):
+        """Test that editing a session line invalidates the footer checksum."""
+        from sagg.bundle import export_bundle, verify_bundle
+
+        for session in sample_sessions:
+            temp_store.save_session(session)
+
+        bundle_path = temp_bundle_dir / "tampered.sagg"
+        export_bundle(temp_store, bundle_path)
+
+        with gzip.open(bundle_path, "rb") as f:
+            lines = f.read().split(b"\n")
+
+        # A trailing newline is tolerated, like the importer's strip()
+        with gzip.open(bundle_path, "wb") as f:
+            f.write(b"\n".join(lines) + b"\n")
+        assert verify_bundle(bundle_path) is True
+
+        lines[1] = lines[1].replace(b'"type": "session"', b'"type":  "session"')
+        with gzip.open(bundle_path, "wb") as f:
+            f.write(b"\n".join(lines))
+        assert verify_bundle(bundle_path) is False
+
     def test_verify_missing_footer(self, temp_store, sample_sessions, temp_bundle_dir):
         """Test verifying a bundle with missing footer."""
         from sagg.bundle import verify_bundle
@@ -312,6 +312,23 @@ class TestConfigSingleton:
 
         assert config1 is config2
 
+    def test_load_config_reuses_unchanged_file(self, temp_config_dir):
+        """load_config should reparse only when the file changes."""
+        import os
+
+        config_path = temp_config_dir / "config.toml"
+        config_path.write_text("[viewer]\nport = 8080\n")
+
+        config1 = load_config(config_path)
+        config2 = load_config(config_path)
+        assert config1 is config2
+
+        config_path.write_text("[viewer]\nport = 9090\n")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_config(config_path).viewer.port == 9090
+
 
 class TestFullConfigFile:
     """Test loading a complete config file matching the spec."""
@@ -12,3 +12,96 @@ def test_markdown_export(sample_session):
     assert "Hello" in md
     assert "Hi there" in md
     assert "### 👤 User" in md
+
+
+def test_agenttrace_export_groups_models_per_file(sample_session):
+    """Test AgentTrace attribution lists each model once per file."""
+    from sagg.export import AgentTraceExporter
+    from sagg.models import FileChangePart, ToolCallPart
+
+    message = sample_session.turns[0].messages[-1]
+    message.model = "model-a"
+    message.parts = [
+        ToolCallPart(tool_name="Edit", tool_id="t1", input={"file_path": "./src/app.py"}),
+        FileChangePart(path="src/app.py"),
+        ToolCallPart(tool_name="Read", tool_id="t2", input={"file_path": "src/other.py"}),
+    ]
+
+    record = AgentTraceExporter().export_session(sample_session)
+
+    assert [f.path for f in record.files] == ["src/app.py"]
+    conversations = record.files[0].conversations
+    assert [c.contributor.model_id for c in conversations] == ["model-a"]
+    assert conversations[0].url == f"local://session/{sample_session.source_id}"
+
+
+def test_agenttrace_export_sessions_shares_timestamp(sample_session):
+    """Test batch AgentTrace export stamps every record with one timestamp."""
+    from sagg.export import AgentTraceExporter
+
+    other = sample_session.model_copy(update={"source_id": "other"})
+    records = list(AgentTraceExporter().export_sessions([sample_session, other]))
+
+    assert [r.metadata.source_session_id for r in records] == [sample_session.source_id, "other"]
+    assert records[0].timestamp == records[1].timestamp
+    assert records[0].id != records[1].id
+
+
+def test_agenttrace_export_to_file(sample_session, tmp_path):
+    """Test AgentTrace export writes the indented record to disk."""
+    import json
+
+    from sagg.export import AgentTraceExporter
+
+    path = tmp_path / "trace.json"
+    AgentTraceExporter().export_to_file(sample_session, path)
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["metadata"]["source_session_id"] == sample_session.source_id
+    assert path.read_text(encoding="utf-8").startswith('{\n  "version"')
+
+
+def test_agenttrace_normalize_path():
+    """Test AgentTrace paths are made relative at the first project root marker."""
+    from sagg.export import AgentTraceExporter
+
+    normalize = AgentTraceExporter()._normalize_path
+
+    assert normalize("./src/app.py") == "src/app.py"
+    assert normalize("/home/u/proj/tests/src/test_x.py") == "tests/src/test_x.py"
+    assert normalize("/home/u/proj/lib") == "lib"
+    assert normalize("/home/u/proj/main.py") == "u/proj/main.py"
+    assert normalize("/proj/main.py") == "/proj/main.py"
+
+
+def test_agenttrace_tool_input_path_priority():
+    """Test the first string-valued path key wins in tool call inputs."""
+    from sagg.export import AgentTraceExporter
+    from sagg.models import ToolCallPart
+
+    extract = AgentTraceExporter()._extract_path_from_tool_call
+
+    def call(input_data):
+        return ToolCallPart(tool_name="Edit", tool_id="t1", input=input_data)
+
+    assert extract(call({"file": "b.py", "filePath": "a.py"})) == "a.py"
+    assert extract(call({"path": 3, "filename": "c.py"})) == "c.py"
+    assert extract(call({"content": "x"})) is None
+    assert extract(call('{"file_path": "d.py"}')) == "d.py"
+
+
+def test_agenttrace_tool_input_raw_path_string():
+    """Test raw path strings are used directly and malformed JSON falls back to them."""
+    from sagg.export import AgentTraceExporter
+    from sagg.models import ToolCallPart
+
+    extract = AgentTraceExporter()._extract_path_from_tool_call
+
+    def call(input_data):
+        return ToolCallPart(tool_name="Edit", tool_id="t1", input=input_data)
+
+    assert extract(call("src/app.py")) == "src/app.py"
+    assert extract(call("main.rs")) == "main.rs"
+    assert extract(call("{not json/")) == "{not json/"
+    assert extract(call('["src/app.py"]')) is None
+    assert extract(call("notes")) is None
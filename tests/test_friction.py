@@ -447,6 +447,21 @@ class TestDetectFrictionPoints:
         for i in range(len(friction_points) - 1):
             assert friction_points[i].friction_score >= friction_points[i + 1].friction_score
 
+    def test_top_limits_results(self, session_store):
+        """Test that top returns only the highest-scoring friction points."""
+        mild = create_session_with_tool_calls([("bash", False)] * 3)
+        severe = create_session_with_tool_calls([("bash", True)] * 6)
+        severe = severe.model_copy(update={"source_id": "test-session-severe"})
+        session_store.save_session(mild)
+        session_store.save_session(severe)
+
+        all_points = detect_friction_points(session_store, retry_threshold=2)
+        top_points = detect_friction_points(session_store, retry_threshold=2, top=1)
+
+        assert len(all_points) == 2
+        assert [fp.session_id for fp in top_points] == [all_points[0].session_id]
+        assert top_points[0].session_id == severe.id
+
 
 class TestFrictionPoint:
     """Tests for FrictionPoint dataclass."""
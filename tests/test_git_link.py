@@ -21,10 +21,12 @@ from sagg.models import (
     TokenUsage,
 )
 from sagg.git_utils import (
+    closest_commit_in,
     get_commits_in_range,
     find_closest_commit,
     get_repo_info,
     is_git_repo,
+    load_commit_timeline,
 )
 
 
@@ -261,6 +263,66 @@ class TestFindClosestCommit:
         assert commit is None
 
 
+class TestCommitTimeline:
+    """Tests for load_commit_timeline and closest_commit_in."""
+
+    def test_timeline_is_sorted(self, temp_git_repo_with_commits):
+        """Test that the timeline is sorted by timestamp."""
+        timeline = load_commit_timeline(temp_git_repo_with_commits)
+
+        timestamps = [c["timestamp"] for c in timeline]
+        assert len(timestamps) > 1
+        assert timestamps == sorted(timestamps)
+
+    def test_timeline_matches_find_closest_commit(self, temp_git_repo_with_commits):
+        """Test that timeline lookups agree with find_closest_commit."""
+        repo_path = temp_git_repo_with_commits
+        timeline = load_commit_timeline(repo_path)
+
+        for timestamp in [
+            datetime(2024, 1, 15, 11, 0, 0, tzinfo=timezone.utc),
+            datetime(2024, 1, 15, 14, 45, 0, tzinfo=timezone.utc),
+            datetime(2024, 2, 1, 12, 0, 0, tzinfo=timezone.utc),
+        ]:
+            expected = find_closest_commit(repo_path, timestamp)
+            actual = closest_commit_in(timeline, timestamp)
+            assert (actual and actual["sha"]) == (expected and expected["sha"])
+
+    def test_timeline_bounded_by_window(self, temp_git_repo_with_commits):
+        """Test that start and end limit which commits are loaded."""
+        timeline = load_commit_timeline(
+            temp_git_repo_with_commits,
+            datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc),
+            datetime(2024, 1, 15, 15, 0, 0, tzinfo=timezone.utc),
+        )
+
+        assert [c["message"] for c in timeline] == ["Fix auth bug"]
+
+    def test_timeline_tolerates_non_utf8_subject(self, temp_git_repo):
+        """Test that a subject git emits in another encoding doesn't drop the timeline."""
+        subprocess.run(
+            ["git", "commit", "--allow-empty", "-m", "Café fix"],
+            cwd=temp_git_repo,
+            check=True,
+            capture_output=True,
+        )
+        subprocess.run(
+            ["git", "config", "i18n.logOutputEncoding", "latin-1"],
+            cwd=temp_git_repo,
+            check=True,
+            capture_output=True,
+        )
+
+        timeline = load_commit_timeline(temp_git_repo)
+
+        assert sorted(c["message"] for c in timeline) == ["Caf\ufffd fix", "Initial commit"]
+
+    def test_timeline_non_git_dir(self, temp_non_git_dir):
+        """Test that non-git directory yields an empty timeline."""
+        assert load_commit_timeline(temp_non_git_dir) == []
+        assert closest_commit_in([], datetime(2024, 1, 15, tzinfo=timezone.utc)) is None
+
+
 class TestGitLinkIntegration:
     """Integration tests for the git-link functionality."""
 
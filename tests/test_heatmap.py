@@ -7,8 +7,11 @@ from collections import defaultdict
 from sagg.analytics.heatmap import (
     get_activity_by_day,
     generate_heatmap_data,
+    generate_heatmap_data_with_totals,
     render_heatmap,
+    render_month_header,
     calculate_intensity,
+    get_month_labels,
 )
 from sagg.models import (
     UnifiedSession,
@@ -211,6 +214,19 @@ class TestGenerateHeatmapData:
         for row in data:
             assert len(row) == 24
 
+    def test_with_totals(self):
+        """Test totals are returned alongside the same grid."""
+        activity = {"2020-01-01": 3, "2020-01-02": 4}
+
+        data, total, active_days = generate_heatmap_data_with_totals(activity, weeks=4)
+
+        assert data == generate_heatmap_data(activity, weeks=4)
+        assert total == 7
+        assert active_days == 2
+
+        _, total, active_days = generate_heatmap_data_with_totals({}, weeks=4)
+        assert (total, active_days) == (0, 0)
+
 
 class TestRenderHeatmap:
     """Tests for render_heatmap function."""
@@ -272,3 +288,16 @@ class TestRenderHeatmap:
                 assert "▓" in output
             elif intensity == 4:
                 assert "█" in output
+
+
+class TestRenderMonthHeader:
+    """Tests for render_month_header function."""
+
+    def test_labels_at_week_positions(self):
+        """Test month names are placed at their week offsets after the indent."""
+        header = render_month_header(12, label_width=6)
+
+        assert header.startswith(" " * 6)
+        for _pos, label in get_month_labels(12):
+            assert label in header
+        assert render_month_header(12, label_width=6) == header
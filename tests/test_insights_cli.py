@@ -57,9 +57,15 @@ class _FakeStore:
                 return s
         return None
 
+    def get_sessions_by_ids(self, session_ids: list[str]) -> dict[str, UnifiedSession]:
+        return {s.id: s for s in self._sessions if s.id in session_ids}
+
     def upsert_facet(self, facet_data: dict) -> None:
         self.upserted.append(facet_data)
 
+    def upsert_facets_bulk(self, facets: list[dict]) -> None:
+        self.upserted.extend(facets)
+
     def get_facets(
         self,
         source: str | None = None,
@@ -70,6 +76,13 @@ class _FakeStore:
         del source, since, project, limit
         return self._existing_facets
 
+    def get_completed_facet_ids(self, analyzer_version: str, **_: object) -> set[str]:
+        return {
+            f["session_id"]
+            for f in self._existing_facets
+            if f.get("analyzer_version") == analyzer_version
+        }
+
     def close(self) -> None:
         return
 
@@ -202,3 +215,116 @@ def test_analyze_sessions_llm_force_resume_skips_already_analyzed(monkeypatch):
     assert "1 skipped already-analyzed" in result.output
     assert len(fake_store.upserted) == 1
     assert fake_store.upserted[0]["session_id"] == second.id
+
+
+def test_analyze_sessions_llm_concurrent_batches_fall_back_per_session(monkeypatch):
+    sessions = [_session_with_text(f"Please fix bug number {i}") for i in range(4)]
+    fake_store = _FakeStore(sessions)
+
+    monkeypatch.setattr("sagg.cli.SessionStore", lambda: fake_store)
+
+    from sagg.analytics.insights import cli_llm
+
+    def fake_single(session, backend_name=None):
+        return {
+            "session_id": session.id,
+            "task_type": "bugfix",
+            "outcome": "fully_achieved",
+            "friction_score": 0.0,
+            "brief_summary": None,
+        }
+
+    def fake_batch(batch, backend_name=None):
+        if batch[0].id == sessions[0].id:
+            raise RuntimeError("batch output unparseable")
+        return [fake_single(s, backend_name) for s in batch]
+
+    monkeypatch.setattr(cli_llm, "detect_available_backend", lambda: "claude")
+    monkeypatch.setattr(cli_llm, "is_session_substantive", lambda session: True)
+    monkeypatch.setattr(cli_llm, "analyze_sessions_llm_batch", fake_batch)
+    monkeypatch.setattr(cli_llm, "analyze_session_llm", fake_single)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        ["analyze-sessions", "--analyzer", "llm", "--batch-size", "2", "--concurrency", "2"],
+    )
+
+    assert result.exit_code == 0
+    assert "Analyzed 4 session(s)" in result.output
+    assert sorted(f["session_id"] for f in fake_store.upserted) == sorted(s.id for s in sessions)
+
+
+def test_analyze_sessions_heuristic_counts_failures_and_saves_rest(monkeypatch):
+    sessions = [_session_with_text(f"Please fix bug number {i}") for i in range(3)]
+    fake_store = _FakeStore(sessions)
+
+    monkeypatch.setattr("sagg.cli.SessionStore", lambda: fake_store)
+
+    from sagg.analytics.insights import heuristic
+
+    def fake_analyze(session):
+        if session.id == sessions[1].id:
+            raise ValueError("bad session")
+        return {"session_id": session.id}
+
+    monkeypatch.setattr(heuristic, "analyze_session", fake_analyze)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["analyze-sessions", "--batch-size", "2"])
+
+    assert result.exit_code == 0
+    assert "Analyzed 2 session(s)" in result.output
+    assert "1 errors" in result.output
+    assert [f["session_id"] for f in fake_store.upserted] == [sessions[0].id, sessions[2].id]
+
+
+def test_analyze_sessions_heuristic_skips_unreadable_content(monkeypatch, tmp_path):
+    from sagg.storage import SessionStore
+
+    store = SessionStore(db_path=tmp_path / "db.sqlite", sessions_dir=tmp_path / "sessions")
+    sessions = [_session_with_text(f"Please fix bug number {i}") for i in range(3)]
+    for session in sessions:
+        store.save_session(session)
+    content_path = tmp_path / "sessions" / sessions[1].source.value / f"{sessions[1].id}.jsonl"
+    content_path.write_text("{not valid json\n")
+
+    monkeypatch.setattr("sagg.cli.SessionStore", lambda: store)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["analyze-sessions", "--batch-size", "5"])
+
+    assert result.exit_code == 0, result.output
+    assert "Analyzed 2 session(s)" in result.output
+    assert "1 errors" in result.output
+
+
+def test_analyze_sessions_llm_skips_unreadable_content(monkeypatch, tmp_path):
+    from sagg.storage import SessionStore
+
+    store = SessionStore(db_path=tmp_path / "db.sqlite", sessions_dir=tmp_path / "sessions")
+    sessions = [_session_with_text(f"Please fix bug number {i}") for i in range(2)]
+    for session in sessions:
+        store.save_session(session)
+    content_path = tmp_path / "sessions" / sessions[0].source.value / f"{sessions[0].id}.jsonl"
+    content_path.write_text("{not valid json\n")
+
+    monkeypatch.setattr("sagg.cli.SessionStore", lambda: store)
+
+    from sagg.analytics.insights import cli_llm
+
+    from sagg.analytics.insights.heuristic import analyze_session
+
+    def fake_batch(batch, backend_name=None):
+        return [analyze_session(s) for s in batch]
+
+    monkeypatch.setattr(cli_llm, "detect_available_backend", lambda: "claude")
+    monkeypatch.setattr(cli_llm, "is_session_substantive", lambda session: True)
+    monkeypatch.setattr(cli_llm, "analyze_sessions_llm_batch", fake_batch)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["analyze-sessions", "--analyzer", "llm"])
+
+    assert result.exit_code == 0, result.output
+    assert "Analyzed 1 session(s)" in result.output
+    assert "1 errors" in result.output
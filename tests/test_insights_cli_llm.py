@@ -67,6 +67,16 @@ def test_is_session_substantive_true_for_textual_session():
     assert cli_llm.is_session_substantive(session) is True
 
 
+def test_is_session_substantive_falls_back_to_transcript_length():
+    long_text = _make_session(user_text="Please fix the flaky auth middleware test suite")
+    long_text.stats.message_count = 0
+    assert cli_llm.is_session_substantive(long_text) is True
+
+    short_text = _make_session(user_text="hi")
+    short_text.stats.message_count = 0
+    assert cli_llm.is_session_substantive(short_text) is False
+
+
 def test_analyze_sessions_llm_batch_parses_indexed_response(monkeypatch):
     sessions = [
         _make_session(user_text="fix bug A"),
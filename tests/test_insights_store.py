@@ -117,6 +117,31 @@ class TestUpsertFacet:
         assert retrieved["task_type"] == "refactor"
         assert retrieved["outcome"] == "partial"
 
+    def test_upsert_facets_bulk(self, session_store, sample_session):
+        session_store.save_session(sample_session)
+        second = sample_session.model_copy(update={"id": "bulk-second", "source_id": "bulk-2"})
+        session_store.save_session(second)
+
+        session_store.upsert_facets_bulk(
+            [
+                make_facet(sample_session.id, task_type="bugfix"),
+                make_facet(second.id, task_type="refactor"),
+            ]
+        )
+
+        assert session_store.get_facet(sample_session.id)["task_type"] == "bugfix"
+        assert session_store.get_facet(second.id)["task_type"] == "refactor"
+
+    def test_upsert_facets_bulk_is_atomic(self, session_store, sample_session):
+        session_store.save_session(sample_session)
+        bad = make_facet(sample_session.id)
+        del bad["task_type"]
+
+        with pytest.raises(KeyError):
+            session_store.upsert_facets_bulk([make_facet(sample_session.id), bad])
+
+        assert session_store.get_facet(sample_session.id) is None
+
     def test_facet_json_fields_serialized(self, session_store, sample_session):
         """goal_categories and friction_counts are stored as JSON text in DB."""
         session_store.save_session(sample_session)
@@ -259,6 +284,16 @@ class TestGetFacets:
         facets = session_store.get_facets(limit=1)
         assert len(facets) == 1
 
+    def test_get_completed_facet_ids(self, session_store, sample_session):
+        second = self._save_two_sessions(session_store, sample_session)
+        llm_facet = make_facet(second.id, source="claude")
+        llm_facet["analyzer_version"] = "llm_v1"
+        session_store.upsert_facet(llm_facet)
+
+        assert session_store.get_completed_facet_ids("llm_v1") == {second.id}
+        assert session_store.get_completed_facet_ids("heuristic_v1") == {sample_session.id}
+        assert session_store.get_completed_facet_ids("llm_v1", source="opencode") == set()
+
 
 # ---------------------------------------------------------------------------
 # 5. get_unfaceted_sessions
@@ -339,6 +374,15 @@ class TestGetUnfacetedSessions:
         assert len(unfaceted) == 1
         assert unfaceted[0].id == sample_session.id
 
+    def test_count_unfaceted_sessions(self, session_store, sample_session):
+        session_store.save_session(sample_session)
+        assert session_store.count_unfaceted_sessions() == 1
+        assert session_store.count_unfaceted_sessions(source="claude") == 0
+
+        session_store.upsert_facet(make_facet(sample_session.id, source="opencode"))
+        assert session_store.count_unfaceted_sessions() == 0
+        assert session_store.count_sessions() == 1
+
 
 # ---------------------------------------------------------------------------
 # 6. get_facet_stats
@@ -17,6 +17,7 @@ from sagg.analytics.oracle import (
     search_history,
     extract_snippet,
     format_result,
+    format_time_ago,
 )
 
 
@@ -178,6 +179,15 @@ class TestOracleSearch:
         results = search_history(session_store, "rate", limit=5)
         assert len(results) <= 5
 
+    def test_limited_results_are_top_of_full_ranking(self, session_store, oracle_sessions):
+        """Test that a smaller limit returns the head of the larger ranking."""
+        full = search_history(session_store, "rate", limit=10)
+        top = search_history(session_store, "rate", limit=1)
+
+        assert [r.session_id for r in top] == [r.session_id for r in full[:1]]
+        scores = [r.relevance_score for r in full]
+        assert scores == sorted(scores, reverse=True)
+
     def test_empty_results_for_no_match(self, session_store, oracle_sessions):
         """Test that searching for non-existent content returns empty list."""
         results = search_history(session_store, "xyznonexistent123", limit=10)
@@ -312,6 +322,17 @@ class TestFormatResult:
         # Should show "3 days ago" or similar
         assert "ago" in formatted.lower() or "3" in formatted
 
+    def test_format_time_ago_buckets(self):
+        """Test each time-ago bucket with a fixed reference time."""
+        now = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+        assert format_time_ago(now - timedelta(minutes=5), now) == "5m ago"
+        assert format_time_ago(now - timedelta(hours=3), now) == "3h ago"
+        assert format_time_ago(now - timedelta(days=2), now) == "2 days ago"
+        assert format_time_ago(now - timedelta(weeks=6), now) == "6 weeks ago"
+        # Naive timestamps are treated as UTC
+        assert format_time_ago(datetime(2024, 6, 1, 11, 0), now) == "1h ago"
+
 
 class TestOracleResultDataclass:
     """Tests for the OracleResult dataclass."""
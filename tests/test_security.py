@@ -33,3 +33,46 @@ def test_scrubber_object():
     scrubbed = scrubber.scrub_object(data)
     assert "sk-" not in scrubbed["key"]
     assert "ghp_" not in scrubbed["nested"]["list"][1]
+
+
+def test_scrub_session_redacts_message_text(sample_session):
+    """Test export scrubbing of a full session model."""
+    from sagg.cli import _scrub_session
+    from sagg.models import TextPart
+
+    message = sample_session.turns[0].messages[0]
+    message.parts = [TextPart(content="token sk-1234567890abcdef12345678")]
+
+    scrubbed = _scrub_session(DataScrubber(), sample_session)
+
+    assert type(scrubbed) is type(sample_session)
+    assert scrubbed.id == sample_session.id
+    assert "[REDACTED:OPENAI_KEY]" in scrubbed.turns[0].messages[0].parts[0].content
+
+
+def test_export_scrub_json_matches_model_dump(tmp_path, sample_session):
+    """Test single-session JSON export scrubs the dump without revalidating it."""
+    import json
+    from unittest.mock import patch
+
+    from click.testing import CliRunner
+
+    from sagg.cli import _scrub_session, cli
+    from sagg.models import TextPart
+    from sagg.storage import SessionStore
+
+    message = sample_session.turns[0].messages[0]
+    message.parts = [TextPart(content="token sk-1234567890abcdef12345678")]
+    store = SessionStore(db_path=tmp_path / "db.sqlite", sessions_dir=tmp_path / "sessions")
+    store.save_session(sample_session)
+    out = tmp_path / "out.json"
+
+    with patch("sagg.cli.SessionStore", return_value=store):
+        result = CliRunner().invoke(cli, ["export", sample_session.id, "--scrub", "-o", str(out)])
+
+    assert result.exit_code == 0, result.output
+    stored = store.get_session(sample_session.id)
+    expected = _scrub_session(DataScrubber(), stored).model_dump_json(indent=2)
+    assert out.read_text() == expected
+    parts = json.loads(expected)["turns"][0]["messages"][0]["parts"]
+    assert "[REDACTED:OPENAI_KEY]" in parts[0]["content"]
@@ -176,6 +176,14 @@ class TestCosineSimilarity:
         similarity = cosine_similarity(vec1, vec2)
         assert similarity == 0.0
 
+    def test_precomputed_magnitude(self):
+        """Test that a precomputed magnitude gives the same score."""
+        vec1 = {"a": 3.0, "b": 4.0}
+        vec2 = {"a": 1.0, "c": 2.0, "d": 2.0}
+        expected = cosine_similarity(vec1, vec2)
+        assert cosine_similarity(vec1, vec2, magnitude1=5.0) == pytest.approx(expected)
+        assert cosine_similarity(vec2, vec1) == pytest.approx(expected)
+
 
 class TestFindSimilarSessions:
     """Tests for finding similar sessions."""
@@ -361,6 +369,24 @@ class TestFindSimilarSessions:
             # Should have some matched terms
             assert len(results[0].matched_terms) > 0
 
+    def test_matched_terms_follow_query_order(self, session_store):
+        """Test that matched terms are reported in the order the query uses them."""
+        session = self.create_session(
+            "JWT token refresh",
+            "Implement JWT token authentication with refresh tokens",
+            "backend",
+        )
+        session_store.save_session(session)
+
+        results = find_similar_sessions(
+            session_store,
+            query="refresh jwt token",
+            limit=5,
+        )
+
+        assert results
+        assert results[0].matched_terms == ["refresh", "jwt", "token"]
+
     def test_no_results_for_unmatched_query(self, session_store):
         """Test that no results are returned for completely unmatched query."""
         session = self.create_session(
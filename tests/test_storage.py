@@ -33,6 +33,23 @@ def test_list_sessions(session_store, sample_session):
     assert len(sessions) == 0
 
 
+def test_list_session_summaries(session_store, sample_session):
+    """Test summary rows match the hydrated listing."""
+    session_store.save_session(sample_session)
+
+    summaries = session_store.list_session_summaries()
+    assert summaries == [
+        (
+            sample_session.id,
+            "opencode",
+            sample_session.title,
+            sample_session.project_name,
+            sample_session.created_at.replace(microsecond=0),
+        )
+    ]
+    assert session_store.list_session_summaries(source="claude") == []
+
+
 def test_search_sessions(session_store, sample_session):
     """Test FTS search."""
     session_store.save_session(sample_session)
@@ -56,3 +73,151 @@ def test_session_exists(session_store, sample_session):
     session_store.save_session(sample_session)
     assert session_store.session_exists(sample_session.source, sample_session.source_id)
     assert not session_store.session_exists("claude", "fake-id")
+
+
+def test_get_source_ids(session_store, sample_session):
+    """Test fetching every stored source ID for a source."""
+    session_store.save_session(sample_session)
+    assert session_store.get_source_ids(sample_session.source) == {sample_session.source_id}
+    assert session_store.get_source_ids("nonexistent") == set()
+
+
+def test_iter_sessions_for_summary(session_store, sample_session):
+    """Test summary rows come back ordered by project, then newest first."""
+    from datetime import timedelta
+
+    sample_session.stats.files_modified = ["src/a.py", "src/b.py"]
+    base = sample_session.updated_at
+    for i, proj in enumerate(["beta", "alpha", None, "alpha"]):
+        session = sample_session.model_copy(
+            update={
+                "id": f"sess-{i}",
+                "source_id": f"source-{i}",
+                "project_name": proj,
+                "updated_at": base - timedelta(days=i),
+            }
+        )
+        session_store.save_session(session)
+
+    rows = list(session_store.iter_sessions_for_summary())
+    assert [(r[0], r[1]) for r in rows] == [
+        ("Unknown Project", (base - timedelta(days=2)).date().isoformat()),
+        ("alpha", (base - timedelta(days=1)).date().isoformat()),
+        ("alpha", (base - timedelta(days=3)).date().isoformat()),
+        ("beta", base.date().isoformat()),
+    ]
+    assert all(r[4] == [] and r[5] == 0 for r in rows)
+
+    detailed = list(session_store.iter_sessions_for_summary(project="beta", files_limit=1))
+    assert [r[0] for r in detailed] == ["beta"]
+    assert detailed[0][4:] == (["src/a.py"], 2)
+
+
+def test_iter_sessions_pages(session_store, sample_session):
+    """Test keyset-paginated iteration across page boundaries."""
+    from datetime import timedelta
+
+    base = sample_session.updated_at
+    for i in range(5):
+        session = sample_session.model_copy(
+            update={
+                "id": f"sess-{i}",
+                "source_id": f"source-{i}",
+                # Two sessions share a timestamp to exercise the id tie-break
+                "updated_at": base - timedelta(hours=min(i, 3)),
+            }
+        )
+        session_store.save_session(session)
+
+    ids = [s.id for s in session_store.iter_sessions(page_size=2)]
+    assert ids == ["sess-0", "sess-1", "sess-2", "sess-4", "sess-3"]
+
+    recent = list(session_store.iter_sessions(since=base - timedelta(hours=1), page_size=2))
+    assert [s.id for s in recent] == ["sess-0", "sess-1"]
+
+
+def test_iter_sessions_full_pages_with_content(session_store, sample_session):
+    """Test full-session iteration loads content and honours the limit."""
+    from datetime import timedelta
+
+    base = sample_session.created_at
+    for i in range(5):
+        session = sample_session.model_copy(
+            update={
+                "id": f"sess-{i}",
+                "source_id": f"source-{i}",
+                "created_at": base - timedelta(hours=min(i, 3)),
+            }
+        )
+        session_store.save_session(session)
+
+    sessions = list(session_store.iter_sessions_full(page_size=2))
+    assert [s.id for s in sessions] == ["sess-0", "sess-1", "sess-2", "sess-4", "sess-3"]
+    assert all(len(s.turns) == len(sample_session.turns) for s in sessions)
+
+    limited = list(session_store.iter_sessions_full(limit=3, page_size=2))
+    assert [s.id for s in limited] == ["sess-0", "sess-1", "sess-2"]
+
+    recent = session_store.iter_sessions_full(since=base - timedelta(hours=2), page_size=1)
+    assert [s.id for s in recent] == ["sess-0", "sess-1", "sess-2"]
+    assert list(session_store.iter_sessions_full(source="nonexistent")) == []
+
+
+def test_find_by_id_prefix(session_store, sample_session):
+    """Test prefix lookup of session IDs."""
+    for session_id in ("abc-1", "abc-2", "abd-1", "ABC-3"):
+        session_store.save_session(
+            sample_session.model_copy(update={"id": session_id, "source_id": session_id})
+        )
+
+    assert session_store.find_by_id_prefix("abc") == ["abc-1", "abc-2"]
+    assert session_store.find_by_id_prefix("abc", limit=1) == ["abc-1"]
+    assert session_store.find_by_id_prefix("abd") == ["abd-1"]
+    assert session_store.find_by_id_prefix("zzz") == []
+    assert session_store.find_by_id_prefix("") == []
+
+
+def test_update_git_contexts(session_store, sample_session):
+    """Test batched git context updates keep content and search intact."""
+    from sagg.models import GitContext
+
+    session_store.save_session(sample_session)
+
+    updated = session_store.update_git_contexts(
+        [(sample_session.id, GitContext(branch="main", commit="abc123"))]
+    )
+    assert updated == 1
+
+    retrieved = session_store.get_session(sample_session.id)
+    assert retrieved.git.branch == "main"
+    assert retrieved.git.commit == "abc123"
+    assert len(retrieved.turns) == 1
+    assert len(session_store.search_sessions("Hello")) == 1
+
+    assert session_store.update_git_contexts([]) == 0
+
+
+def test_get_sessions_by_ids(session_store, sample_session):
+    """Test batched lookup returns content and skips unknown IDs."""
+    session_store.save_session(sample_session)
+    second = sample_session.model_copy(update={"id": "second-id", "source_id": "second"})
+    session_store.save_session(second)
+
+    found = session_store.get_sessions_by_ids(
+        [sample_session.id, "missing-id", second.id], chunk_size=2
+    )
+
+    assert set(found) == {sample_session.id, second.id}
+    assert len(found[second.id].turns) == 1
+
+
+def test_reopened_store_keeps_wal_mode(temp_db_path):
+    store = SessionStore(db_path=temp_db_path)
+    store.close()
+
+    reopened = SessionStore(db_path=temp_db_path)
+    try:
+        mode = reopened.db.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+    finally:
+        reopened.close()
@@ -331,3 +331,44 @@ class TestWatchMode:
 
         paths = syncer.get_watch_paths()
         assert len(paths) == 0
+
+    def test_watch_batches_groups_events_per_change_set(self, session_store):
+        """Test that watch_batches yields one list per debounced change set."""
+        adapter1 = MockAdapter("opencode")
+        adapter2 = MockAdapter("claude")
+        adapter2.get_default_path = lambda: Path("/tmp/claude")  # type: ignore
+        syncer = SessionSyncer(session_store, [adapter1, adapter2])
+
+        changes = [
+            {(1, "/tmp/mock/a.json"), (1, "/tmp/claude/b.json")},
+            {(1, "/tmp/mock/c.json")},
+        ]
+
+        with patch("watchfiles.watch", return_value=iter(changes)), patch.object(
+            Path, "exists", return_value=True
+        ):
+            batches = list(syncer.watch_batches())
+
+        assert [sorted(e.source for e in batch) for batch in batches] == [
+            ["claude", "opencode"],
+            ["opencode"],
+        ]
+
+    def test_identify_changed_sources_matches_path_prefixes(self, session_store):
+        """Test that changes map to the adapter whose directory contains them."""
+        adapter1 = MockAdapter("opencode")
+        adapter2 = MockAdapter("claude")
+        adapter2.get_default_path = lambda: Path("/tmp/claude")  # type: ignore
+        syncer = SessionSyncer(session_store, [adapter1, adapter2])
+        paths = syncer.get_watch_paths()
+
+        assert syncer._identify_changed_sources({(1, "/tmp/mock/a/b.json")}, paths) == [
+            "opencode"
+        ]
+        # A sibling directory sharing the prefix is not under the adapter's path
+        assert syncer._identify_changed_sources({(1, "/tmp/mockery/x.json")}, paths) == []
+        assert sorted(
+            syncer._identify_changed_sources(
+                {(2, "/tmp/mock"), (1, "/tmp/claude/c.json"), (1, "/tmp/mock/d.json")}, paths
+            )
+        ) == ["claude", "opencode"]